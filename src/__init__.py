@@ -7,9 +7,33 @@ __version__ = "1.0.1"
 __author__ = "Oleksandr Dudynets"
 __email__ = "hello@dudynets.dev"
 
-from .config import AppConfig
-from .admob_api import AdMobAPIClient
-from .forecasting import SARIMAForecaster
-from .data_processor import DataProcessor
+import importlib
+
+# Public classes are imported on first access (PEP 562) so importing the
+# package doesn't pull in pandas, statsmodels and the Google client libraries
+_LAZY_IMPORTS = {
+    "AppConfig": ".config",
+    "AdMobAPIClient": ".admob_api",
+    "SARIMAForecaster": ".forecasting",
+    "DataProcessor": ".data_processor",
+}
 
 __all__ = ["AppConfig", "AdMobAPIClient", "SARIMAForecaster", "DataProcessor"]
+
+
+def __getattr__(name):
+    """Import public classes lazily on first attribute access"""
+
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Include lazily imported classes in dir()"""
+
+    return sorted(list(globals()) + __all__)
@@ -3,18 +3,73 @@ AdMob API integration module
 Handles authentication and data fetching from Google AdMob API
 """
 
-import json
+import functools
 import logging
-from datetime import datetime, timedelta
+import os
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
+import numpy as np
+import orjson
 import pandas as pd
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+# The Google client libraries are imported where they are used, keeping them off
+# the application's startup path until the first API call
+
+# Try to import pyarrow for the Feather cache, fall back to JSON if not available
+try:
+    import pyarrow.feather as feather
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    feather = None
+
+
+def _parse_compact_dates(date_strs: List[str]) -> np.ndarray:
+    """Parse "YYYYMMDD" strings into a datetime64[D] array without a string parser"""
+
+    raw = "".join(date_strs).encode("ascii", errors="replace")
+    if len(raw) != 8 * len(date_strs):
+        return pd.to_datetime(date_strs, format="%Y%m%d", cache=True).values
+
+    digits = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 8).astype(np.int64)
+    digits -= ord("0")
+    if digits.min() < 0 or digits.max() > 9:
+        return pd.to_datetime(date_strs, format="%Y%m%d", cache=True).values
+
+    years = digits[:, :4] @ np.array([1000, 100, 10, 1])
+    months = digits[:, 4:6] @ np.array([10, 1])
+    days = digits[:, 6:] @ np.array([10, 1])
+    if (months < 1).any() or (months > 12).any() or (days < 1).any():
+        return pd.to_datetime(date_strs, format="%Y%m%d", cache=True).values
+
+    # Build dates with datetime64 arithmetic: epoch year + months, then days
+    month_starts = (years - 1970).astype("datetime64[Y]") + (months - 1).astype(
+        "timedelta64[M]"
+    )
+    dates = month_starts.astype("datetime64[D]") + (days - 1).astype("timedelta64[D]")
+
+    # Day overflow (e.g. Feb 30) rolls into the next month, defer to strict parsing
+    if (dates.astype("datetime64[M]") != month_starts).any():
+        return pd.to_datetime(date_strs, format="%Y%m%d", cache=True).values
+    return dates
+
+
+def _revenue_frame(dates, revenue) -> pd.DataFrame:
+    """Build a daily revenue frame from typed arrays without dtype inference"""
+
+    return pd.DataFrame(
+        {"revenue": np.asarray(revenue, dtype=np.float32)},
+        index=pd.DatetimeIndex(dates, dtype="datetime64[ns]", name="date"),
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _date_range(start_date: str, end_date: str) -> pd.DatetimeIndex:
+    """Build (and memoize) the daily index between two dates"""
+
+    return pd.date_range(start=start_date, end=end_date, freq="D", name="date")
 
 
 class AdMobAPIClient:
@@ -23,23 +78,62 @@ class AdMobAPIClient:
     SCOPES = ["https://www.googleapis.com/auth/admob.readonly"]
     API_SERVICE_NAME = "admob"
     API_VERSION = "v1"
+    APPS_PAGE_SIZE = 20000
+    APP_COLUMNS = ["app_id", "name", "platform", "app_store_id"]
+    # Seconds a token must stay valid for to be reused without re-authenticating
+    TOKEN_EXPIRY_MARGIN = 60
 
     def __init__(self, config):
         self.config = config
         self.logger = logging.getLogger(__name__)
         self.service = None
         self.credentials = None
+        self._publisher_account_id: Optional[str] = None
+
+    def _report_type(self) -> str:
+        """Get the configured report type ("network" or "mediation")"""
+
+        return self.config.get("api_settings.report_type", "mediation")
+
+    def is_authenticated(self) -> bool:
+        """Check whether the client holds a token that is not about to expire"""
+
+        creds = self.credentials
+        if not (creds and creds.valid and self.service):
+            return False
+
+        # Credentials.expiry is a naive UTC datetime, or None if it never expires
+        if creds.expiry is None:
+            return True
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return creds.expiry - now > timedelta(seconds=self.TOKEN_EXPIRY_MARGIN)
 
     def authenticate(self) -> bool:
         """Authenticate with Google AdMob API using OAuth2"""
 
+        # Already authenticated in this process with a usable token
+        if self.is_authenticated():
+            return True
+
+        from google.auth.transport.requests import Request
+        from google_auth_httplib2 import AuthorizedHttp
+        from google.oauth2.credentials import Credentials
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from googleapiclient.discovery import build
+        from googleapiclient.http import build_http
+
         try:
-            creds = None
+            creds = self.credentials
             token_file = self.config.get_token_path()
 
-            # Load existing token if available
-            if Path(token_file).exists():
-                creds = Credentials.from_authorized_user_file(token_file, self.SCOPES)
+            # Load existing token if available and not already loaded
+            if creds is None:
+                try:
+                    creds = Credentials.from_authorized_user_file(
+                        token_file, self.SCOPES
+                    )
+                except FileNotFoundError:
+                    creds = None
 
             # If there are no (valid) credentials available, let the user log in
             if not creds or not creds.valid:
@@ -63,13 +157,26 @@ class AdMobAPIClient:
                     )
                     creds = flow.run_local_server(port=0)
 
-                # Save the credentials for the next run
-                with open(token_file, "w") as token:
+                    # A fresh login may belong to a different publisher
+                    self._publisher_account_id = None
+
+                # Save the credentials for the next run, atomically so a crash
+                # mid-write can't leave a truncated token behind
+                tmp_token_file = f"{token_file}.tmp"
+                with open(tmp_token_file, "w") as token:
                     token.write(creds.to_json())
+                os.replace(tmp_token_file, token_file)
 
             self.credentials = creds
+            # One authorized keep-alive connection shared by all service calls,
+            # built by the client so it keeps its socket timeout and redirect
+            # handling; the discovery document ships with the client, so skip
+            # its cache
             self.service = build(
-                self.API_SERVICE_NAME, self.API_VERSION, credentials=creds
+                self.API_SERVICE_NAME,
+                self.API_VERSION,
+                http=AuthorizedHttp(creds, http=build_http()),
+                cache_discovery=False,
             )
 
             # Test the connection
@@ -82,6 +189,8 @@ class AdMobAPIClient:
     def test_connection(self) -> bool:
         """Test the API connection by making a simple request"""
 
+        from googleapiclient.errors import HttpError
+
         try:
             # Get publisher account info
             request = self.service.accounts().list()
@@ -89,6 +198,7 @@ class AdMobAPIClient:
 
             if "account" in response and len(response["account"]) > 0:
                 self.logger.info("Successfully connected to AdMob API")
+                self._publisher_account_id = self._extract_publisher_id(response)
                 return True
             else:
                 self.logger.error("No AdMob accounts found")
@@ -104,32 +214,45 @@ class AdMobAPIClient:
     def get_publisher_account(self) -> Optional[str]:
         """Get the publisher account ID"""
 
+        # The publisher ID doesn't change for a logged-in user
+        if self._publisher_account_id:
+            return self._publisher_account_id
+
         try:
             request = self.service.accounts().list()
             response = request.execute()
 
-            if "account" in response and len(response["account"]) > 0:
-                # Return the first account ID
-                account_info = response["account"][0]
-                return account_info.get("publisherId", account_info.get("name", ""))
-            return None
+            self._publisher_account_id = self._extract_publisher_id(response)
+            return self._publisher_account_id
 
         except Exception as e:
             self.logger.error(f"Error getting publisher account: {e}")
             return None
 
-    def get_apps(self, account_id: str) -> List[Dict]:
+    def _extract_publisher_id(self, response: Dict) -> Optional[str]:
+        """Extract the first publisher account ID from an accounts list response"""
+
+        if "account" in response and len(response["account"]) > 0:
+            # Return the first account ID
+            account_info = response["account"][0]
+            return account_info.get("publisherId", account_info.get("name", ""))
+        return None
+
+    def get_apps(self, account_id: str) -> pd.DataFrame:
         """Get list of apps for the publisher account"""
 
         try:
-            request = (
-                self.service.accounts().apps().list(parent=f"accounts/{account_id}")
+            # Request the largest page size the API allows to minimize round-trips
+            apps_resource = self.service.accounts().apps()
+            request = apps_resource.list(
+                parent=f"accounts/{account_id}", pageSize=self.APPS_PAGE_SIZE
             )
-            response = request.execute()
 
             apps = []
-            if "apps" in response:
-                for app in response["apps"]:
+            while request is not None:
+                response = request.execute()
+
+                for app in response.get("apps", []):
                     apps.append(
                         {
                             "app_id": app.get("appId", ""),
@@ -139,135 +262,150 @@ class AdMobAPIClient:
                         }
                     )
 
-            return apps
+                # Page tokens are sequential, so pages have to be fetched in order
+                request = apps_resource.list_next(request, response)
+
+            # Platform values repeat across apps, so store them as a category
+            apps_df = pd.DataFrame(apps, columns=self.APP_COLUMNS).astype(
+                {"platform": "category"}
+            )
+            self.logger.debug(
+                f"Apps frame uses {apps_df.memory_usage(deep=True).sum()} bytes"
+            )
+
+            return apps_df
 
         except Exception as e:
             self.logger.error(f"Error getting apps: {e}")
-            return []
+            return pd.DataFrame(columns=self.APP_COLUMNS)
+
+    def _build_report_request(
+        self, account_id: str, start_date: str, end_date: str, report_type: str
+    ):
+        """Build a report generation request for the given date range"""
+
+        # Create the request body
+        request_body = {
+            "reportSpec": {
+                "dateRange": {
+                    "startDate": {
+                        "year": int(start_date[:4]),
+                        "month": int(start_date[5:7]),
+                        "day": int(start_date[8:10]),
+                    },
+                    "endDate": {
+                        "year": int(end_date[:4]),
+                        "month": int(end_date[5:7]),
+                        "day": int(end_date[8:10]),
+                    },
+                },
+                "dimensions": ["DATE"],
+                "metrics": ["ESTIMATED_EARNINGS"],
+                "sortConditions": [{"dimension": "DATE", "order": "ASCENDING"}],
+                "localizationSettings": {
+                    "currencyCode": "USD",
+                    "languageCode": "en-US",
+                },
+            }
+        }
+
+        # Build the API request based on report type
+        if report_type == "network":
+            return (
+                self.service.accounts()
+                .networkReport()
+                .generate(parent=f"accounts/{account_id}", body=request_body)
+            )
+        else:  # mediation
+            return (
+                self.service.accounts()
+                .mediationReport()
+                .generate(parent=f"accounts/{account_id}", body=request_body)
+            )
+
+    def _parse_report_response(self, response) -> pd.DataFrame:
+        """Parse a report response into a revenue DataFrame indexed by date"""
+
+        # Handle different response formats
+        if isinstance(response, list):
+            # Response is a list of rows (new format), skip header and footer rows
+            rows = [row_data["row"] for row_data in response if "row" in row_data]
+        elif isinstance(response, dict) and "rows" in response:
+            # Response is a dict with 'rows' key (old format)
+            rows = [row_data.get("row", row_data) for row_data in response["rows"]]
+        else:
+            rows = []
+
+        # Collect raw values, parse them in one pass afterwards
+        date_strs = []
+        earnings_micros = []
+
+        for row in rows:
+            # Extract date - can be in different formats
+            date_info = row["dimensionValues"]["DATE"]
+            if "value" in date_info:
+                # Format: "20231024"
+                date_strs.append(date_info["value"])
+            else:
+                # Format: {year: 2023, month: 10, day: 24}
+                date_strs.append(
+                    f"{date_info['year']:04d}{date_info['month']:02d}{date_info['day']:02d}"
+                )
+
+            # Extract earnings - can be microsAmount or microsValue
+            earnings_info = row["metricValues"]["ESTIMATED_EARNINGS"]
+            if "microsValue" in earnings_info:
+                earnings_micros.append(int(earnings_info["microsValue"]))
+            else:
+                earnings_micros.append(int(earnings_info["microsAmount"]))
+
+        if not date_strs:
+            return pd.DataFrame()
+
+        # float32 keeps cent precision for daily totals up to ~$160k
+        revenue = np.asarray(earnings_micros, dtype=np.int64).astype(
+            np.float32
+        ) / np.float32(1_000_000)
+
+        df = _revenue_frame(_parse_compact_dates(date_strs), revenue)
+
+        # Rows are requested sorted by date, only sort if the API didn't honour it
+        if not df.index.is_monotonic_increasing:
+            df.sort_index(inplace=True)
+
+        return df
 
     def generate_report(
-        self, account_id: str, start_date: str, end_date: str
+        self,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        report_type: Optional[str] = None,
     ) -> pd.DataFrame:
         """Generate revenue report (network or mediation) based on user settings"""
 
+        from googleapiclient.errors import HttpError
+
         try:
-            # Get report type from settings
-            report_type = self.config.get("api_settings.report_type", "mediation")
-
-            # Create the request body
-            request_body = {
-                "reportSpec": {
-                    "dateRange": {
-                        "startDate": {
-                            "year": int(start_date[:4]),
-                            "month": int(start_date[5:7]),
-                            "day": int(start_date[8:10]),
-                        },
-                        "endDate": {
-                            "year": int(end_date[:4]),
-                            "month": int(end_date[5:7]),
-                            "day": int(end_date[8:10]),
-                        },
-                    },
-                    "dimensions": ["DATE"],
-                    "metrics": ["ESTIMATED_EARNINGS"],
-                    "sortConditions": [{"dimension": "DATE", "order": "ASCENDING"}],
-                    "localizationSettings": {
-                        "currencyCode": "USD",
-                        "languageCode": "en-US",
-                    },
-                }
-            }
+            report_type = report_type or self._report_type()
 
             self.logger.info(
                 f"Generating {report_type} report for {start_date} to {end_date}"
             )
 
-            # Make the API request based on report type
-            if report_type == "network":
-                request = (
-                    self.service.accounts()
-                    .networkReport()
-                    .generate(parent=f"accounts/{account_id}", body=request_body)
-                )
-            else:  # mediation
-                request = (
-                    self.service.accounts()
-                    .mediationReport()
-                    .generate(parent=f"accounts/{account_id}", body=request_body)
-                )
-
+            request = self._build_report_request(
+                account_id, start_date, end_date, report_type
+            )
             response = request.execute()
 
-            # Parse the response
-            data = []
-
-            # Handle different response formats
-            if isinstance(response, list):
-                # Response is a list of rows (new format)
-                for row_data in response:
-                    # Skip header and footer rows
-                    if "row" not in row_data:
-                        continue
-
-                    row = row_data["row"]
-
-                    # Extract date - can be in different formats
-                    date_info = row["dimensionValues"]["DATE"]
-                    if "value" in date_info:
-                        # Format: "20231024" -> "2023-10-24"
-                        date_value = date_info["value"]
-                        date_str = (
-                            f"{date_value[:4]}-{date_value[4:6]}-{date_value[6:8]}"
-                        )
-                    else:
-                        # Format: {year: 2023, month: 10, day: 24}
-                        date_str = f"{date_info['year']}-{date_info['month']:02d}-{date_info['day']:02d}"
-
-                    # Extract earnings - can be microsAmount or microsValue
-                    earnings_info = row["metricValues"]["ESTIMATED_EARNINGS"]
-                    if "microsValue" in earnings_info:
-                        earnings = float(earnings_info["microsValue"]) / 1000000
-                    else:
-                        earnings = float(earnings_info["microsAmount"]) / 1000000
-
-                    data.append({"date": pd.to_datetime(date_str), "revenue": earnings})
-
-            elif isinstance(response, dict) and "rows" in response:
-                # Response is a dict with 'rows' key (old format)
-                for row_data in response["rows"]:
-                    # Handle the response format: each row is wrapped in a "row" object
-                    row = row_data.get("row", row_data)
-
-                    # Extract date - can be in different formats
-                    date_info = row["dimensionValues"]["DATE"]
-                    if "value" in date_info:
-                        # Format: "20231024" -> "2023-10-24"
-                        date_value = date_info["value"]
-                        date_str = (
-                            f"{date_value[:4]}-{date_value[4:6]}-{date_value[6:8]}"
-                        )
-                    else:
-                        # Format: {year: 2023, month: 10, day: 24}
-                        date_str = f"{date_info['year']}-{date_info['month']:02d}-{date_info['day']:02d}"
-
-                    # Extract earnings - can be microsAmount or microsValue
-                    earnings_info = row["metricValues"]["ESTIMATED_EARNINGS"]
-                    if "microsValue" in earnings_info:
-                        earnings = float(earnings_info["microsValue"]) / 1000000
-                    else:
-                        earnings = float(earnings_info["microsAmount"]) / 1000000
-
-                    data.append({"date": pd.to_datetime(date_str), "revenue": earnings})
+            df = self._parse_report_response(response)
 
             self.logger.info(
-                f"Retrieved {len(data)} data points using {report_type} report"
+                f"Retrieved {len(df)} data points using {report_type} report"
+            )
+            self.logger.debug(
+                f"Report frame uses {df.memory_usage(deep=True).sum()} bytes"
             )
-
-            df = pd.DataFrame(data)
-            if not df.empty:
-                df = df.sort_values("date").reset_index(drop=True)
-                df.set_index("date", inplace=True)
 
             return df
 
@@ -278,7 +416,9 @@ class AdMobAPIClient:
             self.logger.error(f"Error generating {report_type} report: {e}")
             return pd.DataFrame()
 
-    def get_revenue_data(self, start_date: str, end_date: str) -> pd.DataFrame:
+    def get_revenue_data(
+        self, start_date: str, end_date: str, report_type: Optional[str] = None
+    ) -> pd.DataFrame:
         """Get revenue data for the specified date range"""
 
         try:
@@ -295,7 +435,7 @@ class AdMobAPIClient:
             self.logger.info(f"Fetching revenue data from {start_date} to {end_date}")
 
             # Generate report
-            df = self.generate_report(account_id, start_date, end_date)
+            df = self.generate_report(account_id, start_date, end_date, report_type)
 
             if df.empty:
                 self.logger.warning(
@@ -320,38 +460,64 @@ class AdMobAPIClient:
 
         try:
             # Create a complete date range
-            date_range = pd.date_range(start=start_date, end=end_date, freq="D")
+            date_range = _date_range(start_date, end_date)
 
-            # Reindex the dataframe to include all dates
-            df = df.reindex(date_range, fill_value=0)
-            df.index.name = "date"
+            # Scatter known revenue into a zero-filled (C-contiguous) array
+            revenue = np.zeros(len(date_range), dtype=np.float32)
+            if "revenue" in df.columns:
+                indexer = df.index.get_indexer(date_range)
+                found = indexer >= 0
+                revenue[found] = df["revenue"].to_numpy()[indexer[found]]
 
-            # Ensure revenue column exists
-            if "revenue" not in df.columns:
-                df["revenue"] = 0
-
-            return df
+            # Shallow copy so renaming the result's index can't touch the cache
+            return _revenue_frame(date_range.copy(), revenue)
 
         except Exception as e:
             self.logger.error(f"Error filling missing dates: {e}")
             return df
 
-    def get_cached_data(self, start_date: str, end_date: str) -> Optional[pd.DataFrame]:
+    def get_cached_data(
+        self, start_date: str, end_date: str, report_type: Optional[str] = None
+    ) -> Optional[pd.DataFrame]:
         """Get cached revenue data if available and valid"""
 
         try:
-            report_type = self.config.get("api_settings.report_type", "mediation")
+            report_type = report_type or self._report_type()
             cache_key = f"revenue_{report_type}_{start_date}_{end_date}"
-            cache_file = self.config.get_cache_file(cache_key)
 
-            if self.config.is_cache_valid(cache_file):
-                with open(cache_file, "r") as f:
-                    data = json.load(f)
+            # Columnar Feather cache
+            if PYARROW_AVAILABLE:
+                cache_file = self.config.get_cache_file(cache_key)
+
+                if self.config.is_cache_valid(cache_file):
+                    # Memory-map the Arrow IPC file so pages are read on demand
+                    table = feather.read_table(str(cache_file), memory_map=True)
+                    df = table.to_pandas().set_index("date")
+                    if not df.empty:
+                        self.logger.info(
+                            f"Using cached {report_type} revenue data from {start_date} to {end_date}"
+                        )
+                        return df
+
+            # JSON cache (written without pyarrow or by older versions)
+            cache_file = self.config.get_cache_file(cache_key, "json")
 
-                df = pd.DataFrame(data)
+            if self.config.is_cache_valid(cache_file):
+                with open(cache_file, "rb") as f:
+                    data = orjson.loads(f.read())
+
+                # Column-wise payload; older cache files hold a list of records
+                if isinstance(data, list):
+                    data = {
+                        "date": [record["date"][:10] for record in data],
+                        "revenue": [record["revenue"] for record in data],
+                    }
+
+                df = _revenue_frame(
+                    pd.to_datetime(data["date"], format="%Y-%m-%d", cache=True),
+                    data["revenue"],
+                )
                 if not df.empty:
-                    df["date"] = pd.to_datetime(df["date"])
-                    df.set_index("date", inplace=True)
                     self.logger.info(
                         f"Using cached {report_type} revenue data from {start_date} to {end_date}"
                     )
@@ -363,21 +529,36 @@ class AdMobAPIClient:
             self.logger.error(f"Error loading cached data: {e}")
             return None
 
-    def cache_data(self, df: pd.DataFrame, start_date: str, end_date: str):
+    def cache_data(
+        self,
+        df: pd.DataFrame,
+        start_date: str,
+        end_date: str,
+        report_type: Optional[str] = None,
+    ):
         """Cache revenue data for future use"""
 
         try:
-            report_type = self.config.get("api_settings.report_type", "mediation")
+            report_type = report_type or self._report_type()
             cache_key = f"revenue_{report_type}_{start_date}_{end_date}"
-            cache_file = self.config.get_cache_file(cache_key)
 
-            # Convert DataFrame to JSON-serializable format
-            data = df.reset_index().to_dict("records")
-            for record in data:
-                record["date"] = record["date"].isoformat()
+            if PYARROW_AVAILABLE:
+                cache_file = self.config.get_cache_file(cache_key)
+                # Uncompressed so reads can use the memory-mapped buffers as-is
+                feather.write_feather(
+                    df.reset_index(), str(cache_file), compression="uncompressed"
+                )
+            else:
+                cache_file = self.config.get_cache_file(cache_key, "json")
 
-            with open(cache_file, "w") as f:
-                json.dump(data, f, indent=2)
+                # Store columns rather than one dict per row
+                data = {
+                    "date": df.index.strftime("%Y-%m-%d").tolist(),
+                    "revenue": df["revenue"].tolist(),
+                }
+
+                with open(cache_file, "wb") as f:
+                    f.write(orjson.dumps(data))
 
             self.logger.info(
                 f"Cached {report_type} revenue data for {start_date} to {end_date}"
@@ -392,18 +573,21 @@ class AdMobAPIClient:
         """Fetch revenue data with caching support"""
 
         try:
+            # Resolve the report type once for the whole fetch
+            report_type = self._report_type()
+
             # Try to get cached data first
             if use_cache:
-                cached_data = self.get_cached_data(start_date, end_date)
+                cached_data = self.get_cached_data(start_date, end_date, report_type)
                 if cached_data is not None:
                     return cached_data
 
             # Fetch fresh data from API
-            df = self.get_revenue_data(start_date, end_date)
+            df = self.get_revenue_data(start_date, end_date, report_type)
 
             # Cache the data
             if not df.empty:
-                self.cache_data(df, start_date, end_date)
+                self.cache_data(df, start_date, end_date, report_type)
 
             return df
 
@@ -4,13 +4,29 @@ Handles settings, authentication, and application configuration
 """
 
 import os
-import json
-from datetime import datetime, timedelta
+from collections import deque
+import orjson
+from datetime import date, datetime, timedelta
 from typing import Dict, Any, Optional
 from pathlib import Path
 import logging
 
 
+def _flatten_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Map the dot path of every section and value in a nested config to it"""
+
+    flat = {}
+    pending = [("", config)]
+    while pending:
+        prefix, section = pending.pop()
+        for key, value in section.items():
+            path = f"{prefix}{key}"
+            flat[path] = value
+            if isinstance(value, dict):
+                pending.append((f"{path}.", value))
+    return flat
+
+
 class AppConfig:
     """Application configuration and settings management"""
 
@@ -31,8 +47,11 @@ class AppConfig:
         self.credentials_file = self.config_dir / "credentials.json"
         self.token_file = self.config_dir / "token.json"
 
-        # Create config directory if it doesn't exist
+        self.cache_dir = self.config_dir / "cache"
+
+        # Create config and cache directories if they don't exist
         self.config_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir.mkdir(exist_ok=True)
 
         # Default configuration
         self.default_config = {
@@ -46,6 +65,7 @@ class AppConfig:
                 "sarima_order": [1, 1, 1],
                 "seasonal_order": [1, 1, 1, 7],
                 "confidence_interval": 0.95,
+                "use_statsforecast": True,
             },
             "ui_settings": {
                 "window_width": 1400,
@@ -61,28 +81,37 @@ class AppConfig:
             },
         }
 
+        # Flat dot-path view of the configuration, rebuilt after every change
+        self._flat: Dict[str, Any] = {}
+        self._min_date: Optional[date] = None
+
         self.config = self.load_config()
         self.setup_logging()
 
     def setup_logging(self):
         """Setup application logging"""
 
-        log_file = self.config_dir / "app.log"
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s - %(levelname)s - %(message)s",
-            handlers=[logging.FileHandler(log_file), logging.StreamHandler()],
-        )
+        # basicConfig ignores repeat calls, but the FileHandler passed to it would
+        # still be opened (and leaked) for every AppConfig instance
+        if not logging.getLogger().handlers:
+            log_file = self.config_dir / "app.log"
+            logging.basicConfig(
+                level=logging.INFO,
+                format="%(asctime)s - %(levelname)s - %(message)s",
+                handlers=[logging.FileHandler(log_file), logging.StreamHandler()],
+            )
 
         self.logger = logging.getLogger(__name__)
 
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from file or create default"""
 
+        self._invalidate_caches()
+
         try:
             if self.config_file.exists():
-                with open(self.config_file, "r") as f:
-                    config = json.load(f)
+                with open(self.config_file, "rb") as f:
+                    config = orjson.loads(f.read())
 
                 # Merge with default config to ensure all keys exist
                 return self.merge_config(self.default_config, config)
@@ -99,8 +128,8 @@ class AppConfig:
         try:
             config_to_save = config or self.config
 
-            with open(self.config_file, "w") as f:
-                json.dump(config_to_save, f, indent=2)
+            with open(self.config_file, "wb") as f:
+                f.write(orjson.dumps(config_to_save, option=orjson.OPT_INDENT_2))
         except Exception as e:
             logging.error(f"Error saving config: {e}")
 
@@ -111,32 +140,60 @@ class AppConfig:
 
         result = default.copy()
 
-        for key, value in user.items():
-            if (
-                key in result
-                and isinstance(result[key], dict)
-                and isinstance(value, dict)
-            ):
-                result[key] = self.merge_config(result[key], value)
-            else:
-                result[key] = value
+        # Walk nested sections with an explicit stack instead of recursing,
+        # copying only the default sections that user values are merged into
+        pending = deque([(result, user)])
+        while pending:
+            target, source = pending.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    merged = current.copy()
+                    target[key] = merged
+                    pending.append((merged, value))
+                else:
+                    target[key] = value
         return result
 
     def get(self, key_path: str, default: Any = None) -> Any:
         """Get configuration value using dot notation (e.g., 'api_settings.client_id')"""
 
-        keys = key_path.split(".")
-        value = self.config
+        # Index the whole configuration once, so each lookup is a single dict get.
+        # Read the index once: worker threads call this while the GUI thread
+        # may reset it between the rebuild and the lookup
+        flat = self._flat
+        if not flat:
+            flat = self._flat = _flatten_config(self.config)
 
-        try:
-            for key in keys:
-                value = value[key]
-            return value
-        except (KeyError, TypeError):
-            return default
+        return flat.get(key_path, default)
 
     def set(self, key_path: str, value: Any):
         """Set configuration value using dot notation"""
+        self._set_value(key_path, value)
+        self._invalidate_caches()
+        self.save_config()
+
+    def update(self, values: Dict[str, Any]) -> bool:
+        """Set several dot-notation values, writing the file once if any changed"""
+
+        _missing = object()
+        changed = {
+            key_path: value
+            for key_path, value in values.items()
+            if self.get(key_path, _missing) != value
+        }
+        if not changed:
+            return False
+
+        for key_path, value in changed.items():
+            self._set_value(key_path, value)
+        self._invalidate_caches()
+        self.save_config()
+        return True
+
+    def _set_value(self, key_path: str, value: Any):
+        """Store a value at a dot-notation path without saving"""
+
         keys = key_path.split(".")
         config = self.config
 
@@ -148,15 +205,24 @@ class AppConfig:
 
         # Set the value
         config[keys[-1]] = value
-        self.save_config()
+
+    def _invalidate_caches(self):
+        """Drop values derived from the current configuration"""
+
+        self._flat = {}
+        self._min_date = None
 
     def get_date_range(self) -> tuple:
         """Get the valid date range for data fetching"""
 
-        min_date = datetime.strptime(self.get("data_settings.min_date"), "%Y-%m-%d")
+        # Parse the configured minimum date once, it only changes through set()
+        if self._min_date is None:
+            self._min_date = datetime.strptime(
+                self.get("data_settings.min_date"), "%Y-%m-%d"
+            ).date()
         max_date = datetime.now() - timedelta(days=1)  # Yesterday
 
-        return min_date.date(), max_date.date()
+        return self._min_date, max_date.date()
 
     def is_api_configured(self) -> bool:
         """Check if API credentials are configured"""
@@ -204,13 +270,10 @@ class AppConfig:
         except Exception:
             return False
 
-    def get_cache_file(self, cache_key: str) -> Path:
+    def get_cache_file(self, cache_key: str, extension: str = "feather") -> Path:
         """Get cache file path for given cache key"""
 
-        cache_dir = self.config_dir / "cache"
-        cache_dir.mkdir(exist_ok=True)
-
-        return cache_dir / f"{cache_key}.json"
+        return self.cache_dir / f"{cache_key}.{extension}"
 
     def is_cache_valid(self, cache_file: Path) -> bool:
         """Check if cache file is still valid"""
@@ -228,13 +291,11 @@ class AppConfig:
         """Clear all cached data"""
 
         try:
-            cache_dir = self.config_dir / "cache"
-
-            if cache_dir.exists():
+            if self.cache_dir.exists():
                 import shutil
 
-                shutil.rmtree(cache_dir)
-                cache_dir.mkdir(exist_ok=True)
+                shutil.rmtree(self.cache_dir)
+                self.cache_dir.mkdir(exist_ok=True)
                 logging.info("Cache cleared successfully")
         except Exception as e:
             logging.error(f"Error clearing cache: {e}")
@@ -3,16 +3,27 @@ Currency Formatter Module
 Handles currency conversion and formatting for the AdMob Revenue Forecaster
 """
 
+import os
 import requests
-import json
+import orjson
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple, Union
 import logging
 
+import numpy as np
+import pandas as pd
+
 
 class CurrencyFormatter:
     """Currency formatter with exchange rate support"""
 
+    # Seconds for which a passed freshness check is trusted without re-checking
+    UPDATE_CHECK_INTERVAL = 60
+
     def __init__(self, config):
         self.config = config
         self.rates = {}
@@ -20,6 +31,9 @@ class CurrencyFormatter:
         self.last_updated = None
         self.base_currency = "USD"
 
+        # Shared session so repeated calls reuse pooled keep-alive connections
+        self._session = requests.Session()
+
         # Use free fawazahmed0/exchange-api - no rate limits, 200+ currencies
         self.api_url = "https://cdn.jsdelivr.net/npm/@fawazahmed0/currency-api@latest/v1/currencies/usd.json"
         self.fallback_api_url = (
@@ -30,15 +44,82 @@ class CurrencyFormatter:
             "https://latest.currency-api.pages.dev/v1/currencies.json"
         )
 
+        # Resolved local currency and the sorted currency choices built from
+        # the currency list object they were derived from
+        self._local_currency: Optional[str] = None
+        self._currency_choices: Tuple[Tuple[str, str], ...] = ()
+        self._available_source: Optional[Dict[str, str]] = None
+
+        # Serializes rate refreshes so concurrent callers don't all refetch
+        self._refresh_lock = threading.Lock()
+        self._last_fresh_check: Optional[float] = None
+
+        # Memoized get_exchange_rate results for the rates updated at this time
+        self._rate_cache: Dict[Tuple[str, str], float] = {}
+        self._rate_cache_updated: Optional[datetime] = None
+
+        # ETag/Last-Modified of the last rates response, per URL
+        self._validators: Dict[str, Dict[str, str]] = {}
+
+        # Rates and currencies persisted between runs, valid until needs_update()
+        self.cache_file = self.config.get_cache_file("exchange_rates", "json")
+        self._load_cached_rates()
+
+    def _load_cached_rates(self):
+        """Load exchange rates and currencies saved by a previous run"""
+
+        try:
+            with open(self.cache_file, "rb") as f:
+                data = orjson.loads(f.read())
+
+            self.rates = data.get("rates", {})
+            self.currencies = data.get("currencies", {})
+            last_updated = data.get("last_updated")
+            self.last_updated = (
+                datetime.fromisoformat(last_updated) if last_updated else None
+            )
+            self._validators = data.get("validators", {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.warning(f"Error loading cached exchange rates: {str(e)}")
+
+    def _save_cached_rates(self):
+        """Persist exchange rates and currencies for the next run"""
+
+        try:
+            data = {
+                "rates": self.rates,
+                "currencies": self.currencies,
+                "last_updated": (
+                    self.last_updated.isoformat() if self.last_updated else None
+                ),
+                "validators": self._validators,
+            }
+
+            # Write to a temp file first so a crash can't leave a truncated cache;
+            # each save gets its own file so concurrent saves can't interleave
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=os.path.dirname(self.cache_file) or ".", delete=False
+            ) as f:
+                f.write(orjson.dumps(data))
+            os.replace(f.name, self.cache_file)
+        except Exception as e:
+            logging.warning(f"Error saving exchange rates cache: {str(e)}")
+
     def get_local_currency(self) -> str:
         """Get the user's local currency setting"""
 
-        return self.config.get("ui_settings.local_currency", "UAH")
+        if self._local_currency is None:
+            self._local_currency = self.config.get("ui_settings.local_currency", "UAH")
+        return self._local_currency
 
     def set_local_currency(self, currency: str):
         """Set the user's local currency"""
 
-        self.config.set("ui_settings.local_currency", currency)
+        # Only switch in memory; the settings tab saves the choice once the
+        # selection settles
+        self._local_currency = currency
         # Clear rates to force refresh
         self.rates = {}
         self.last_updated = None
@@ -49,8 +130,32 @@ class CurrencyFormatter:
         if not self.rates or not self.last_updated:
             return True
 
+        # Throttle: for UPDATE_CHECK_INTERVAL seconds after rates were last found
+        # fresh, skip the staleness check and report them as current
+        now = time.monotonic()
+        if (
+            self._last_fresh_check is not None
+            and now - self._last_fresh_check < self.UPDATE_CHECK_INTERVAL
+        ):
+            return False
+
         # Update rates daily
-        return datetime.now() - self.last_updated > timedelta(days=1)
+        stale = datetime.now() - self.last_updated > timedelta(days=1)
+        self._last_fresh_check = None if stale else now
+        return stale
+
+    def refresh_rates(self) -> bool:
+        """Fetch exchange rates if stale, letting only one caller fetch at a time"""
+
+        if not self.needs_update():
+            return True
+
+        with self._refresh_lock:
+            # Another caller may have refreshed the rates while we waited
+            if not self.needs_update():
+                return True
+
+            return self.fetch_exchange_rates()
 
     def fetch_currencies(self) -> bool:
         """Fetch available currencies from API"""
@@ -59,13 +164,14 @@ class CurrencyFormatter:
             logging.info("Fetching currency list...")
 
             # Try primary API
-            response = requests.get(self.currencies_api_url, timeout=10)
+            response = self._session.get(self.currencies_api_url, timeout=10)
 
             if response.status_code == 200:
-                self.currencies = response.json()
+                self.currencies = orjson.loads(response.content)
                 logging.info(
                     f"Currency list updated successfully. {len(self.currencies)} currencies loaded."
                 )
+                self._save_cached_rates()
                 return True
             else:
                 logging.warning(
@@ -81,13 +187,14 @@ class CurrencyFormatter:
         """Try fallback currencies API"""
 
         try:
-            response = requests.get(self.currencies_fallback_url, timeout=10)
+            response = self._session.get(self.currencies_fallback_url, timeout=10)
 
             if response.status_code == 200:
-                self.currencies = response.json()
+                self.currencies = orjson.loads(response.content)
                 logging.info(
                     f"Currency list updated using fallback API. {len(self.currencies)} currencies loaded."
                 )
+                self._save_cached_rates()
                 return True
             else:
                 logging.warning("Fallback currencies API also failed")
@@ -97,6 +204,37 @@ class CurrencyFormatter:
             logging.error(f"Fallback currencies API error: {str(e)}")
             return False
 
+    def _conditional_headers(self, url: str) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers for a rates request"""
+
+        # Without rates in hand a 304 would leave us with nothing to use
+        if not self.rates:
+            return {}
+
+        validators = self._validators.get(url, {})
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        return headers
+
+    def _remember_validators(self, url: str, response: requests.Response):
+        """Store the cache validators of a successful rates response"""
+
+        self._validators[url] = {
+            "etag": response.headers.get("ETag", ""),
+            "last_modified": response.headers.get("Last-Modified", ""),
+        }
+
+    def _keep_unchanged_rates(self) -> bool:
+        """Treat the current rates as fresh after a 304 Not Modified response"""
+
+        self.last_updated = datetime.now()
+        logging.info("Exchange rates unchanged since last fetch")
+        self._save_cached_rates()
+        return True
+
     def fetch_exchange_rates(self) -> bool:
         """Fetch exchange rates from API"""
 
@@ -104,17 +242,26 @@ class CurrencyFormatter:
             logging.info("Fetching exchange rates...")
 
             # Try primary API
-            response = requests.get(self.api_url, timeout=10)
+            response = self._session.get(
+                self.api_url,
+                headers=self._conditional_headers(self.api_url),
+                timeout=10,
+            )
+
+            if response.status_code == 304:
+                return self._keep_unchanged_rates()
 
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 # The API returns data in format: {"date": "2024-01-15", "usd": {"eur": 0.85, ...}}
                 if "usd" in data:
                     self.rates = data["usd"]
                     self.last_updated = datetime.now()
+                    self._remember_validators(self.api_url, response)
                     logging.info(
                         f"Exchange rates updated successfully. {len(self.rates)} currencies loaded."
                     )
+                    self._save_cached_rates()
                     return True
                 else:
                     logging.warning("Unexpected API response format")
@@ -133,14 +280,23 @@ class CurrencyFormatter:
         """Try fallback exchange rate API"""
 
         try:
-            response = requests.get(self.fallback_api_url, timeout=10)
+            response = self._session.get(
+                self.fallback_api_url,
+                headers=self._conditional_headers(self.fallback_api_url),
+                timeout=10,
+            )
+
+            if response.status_code == 304:
+                return self._keep_unchanged_rates()
 
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 if "usd" in data:
                     self.rates = data["usd"]
                     self.last_updated = datetime.now()
+                    self._remember_validators(self.fallback_api_url, response)
                     logging.info("Exchange rates updated using fallback API")
+                    self._save_cached_rates()
                     return True
                 else:
                     logging.warning("Unexpected fallback API response format")
@@ -162,19 +318,31 @@ class CurrencyFormatter:
             return 1.0
 
         # Update rates if needed
-        if self.needs_update():
-            success = self.fetch_exchange_rates()
-            if not success:
-                logging.warning("Failed to fetch exchange rates")
-                return None
+        if not self.refresh_rates():
+            logging.warning("Failed to fetch exchange rates")
+            return None
 
         # If no rates available, return None
         if not self.rates:
             return None
 
-        # Convert currency codes to lowercase for API
-        from_curr = from_currency.lower()
-        to_curr = to_currency.lower()
+        # Lookups are memoized per rates snapshot, identified by its update time
+        if self._rate_cache_updated != self.last_updated:
+            self._rate_cache.clear()
+            self._rate_cache_updated = self.last_updated
+
+        cache_key = (from_currency, to_currency)
+        rate = self._rate_cache.get(cache_key)
+        if rate is None:
+            rate = self._lookup_rate(from_currency.lower(), to_currency.lower())
+            # Only successful lookups are cached, missing rates are retried
+            if rate is not None:
+                self._rate_cache[cache_key] = rate
+
+        return rate
+
+    def _lookup_rate(self, from_curr: str, to_curr: str) -> Optional[float]:
+        """Compute the rate between two lowercase currency codes via USD"""
 
         if from_curr == "usd":
             return self.rates.get(to_curr)
@@ -216,6 +384,35 @@ class CurrencyFormatter:
 
         return f"{usd_formatted} ({local_formatted})"
 
+    def format_currency_series(
+        self, amounts: Union[pd.Series, np.ndarray], show_local: bool = True
+    ) -> pd.Series:
+        """Format a column of amounts like format_currency, resolving the rate once"""
+
+        if not isinstance(amounts, pd.Series):
+            amounts = pd.Series(amounts)
+
+        values = amounts.to_numpy(dtype=np.float64)
+        usd_formatted = pd.Series(values, index=amounts.index).map("{:,.2f} USD".format)
+
+        if not show_local:
+            return usd_formatted
+
+        local_currency = self.get_local_currency()
+        if local_currency == "USD":
+            return usd_formatted
+
+        exchange_rate = self.get_exchange_rate("USD", local_currency)
+        if exchange_rate is None:
+            return usd_formatted
+
+        # Convert the whole column in one vectorized multiply
+        local_formatted = pd.Series(values * exchange_rate, index=amounts.index).map(
+            f"{{:,.2f}} {local_currency}".format
+        )
+
+        return usd_formatted + " (" + local_formatted + ")"
+
     def format_currency_short(self, amount: float) -> str:
         """Format currency amount in short form (local currency only if different from USD)"""
 
@@ -237,27 +434,37 @@ class CurrencyFormatter:
     def get_available_currencies(self) -> Dict[str, str]:
         """Get list of available currencies"""
 
+        return dict(self.get_currency_choices())
+
+    def get_currency_choices(self) -> Tuple[Tuple[str, str], ...]:
+        """Get (code, label) pairs of available currencies, sorted by code"""
+
         # Update currencies if needed
         if not self.currencies:
             self.fetch_currencies()
 
         # If still no currencies, return basic USD
         if not self.currencies:
-            return {"USD": "USD - United States Dollar"}
+            return (("USD", "USD - United States Dollar"),)
 
-        available = {}
-        for currency_code, currency_name in self.currencies.items():
-            currency_upper = currency_code.upper()
+        # Rebuild the sorted pairs only when the currency list was replaced
+        if self._available_source is not self.currencies:
+            available = {}
+            for currency_code, currency_name in self.currencies.items():
+                currency_upper = currency_code.upper()
 
-            if currency_name:
-                available[currency_upper] = f"{currency_upper} - {currency_name}"
-            else:
-                available[currency_upper] = f"{currency_upper}"
+                if currency_name:
+                    available[currency_upper] = f"{currency_upper} - {currency_name}"
+                else:
+                    available[currency_upper] = f"{currency_upper}"
+
+            # Always include USD
+            available["USD"] = "USD - United States Dollar"
 
-        # Always include USD
-        available["USD"] = "USD - United States Dollar"
+            self._currency_choices = tuple(sorted(available.items()))
+            self._available_source = self.currencies
 
-        return dict(sorted(available.items()))
+        return self._currency_choices
 
     def get_current_exchange_rate(self, currency: str) -> Optional[float]:
         """Get current exchange rate for a specific currency from USD"""
@@ -270,15 +477,22 @@ class CurrencyFormatter:
     def initialize(self):
         """Initialize currency formatter by fetching rates and currencies"""
 
-        # Fetch currencies first
-        currencies_success = self.fetch_currencies()
-        if not currencies_success:
-            logging.warning("Failed to fetch currencies list")
-
-        # Fetch exchange rates
-        if self.needs_update():
-            rates_success = self.fetch_exchange_rates()
-            if not rates_success:
+        # The currency list and the rates are independent, fetch them concurrently.
+        # Both may already be loaded from the cache of a previous run.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            currencies_future = (
+                executor.submit(self.fetch_currencies)
+                if not self.currencies or self.needs_update()
+                else None
+            )
+            rates_future = (
+                executor.submit(self.refresh_rates) if self.needs_update() else None
+            )
+
+            if currencies_future is not None and not currencies_future.result():
+                logging.warning("Failed to fetch currencies list")
+
+            if rates_future is not None and not rates_future.result():
                 logging.warning("Failed to fetch exchange rates")
 
         logging.info(
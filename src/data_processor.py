@@ -8,12 +8,38 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
-import json
+from importlib.util import find_spec
+from types import MappingProxyType
+import orjson
+
+# Use pyarrow's CSV engine for imports when it is installed
+PYARROW_AVAILABLE = find_spec("pyarrow") is not None
+
+# Prefer xlsxwriter for Excel exports when it is installed
+XLSXWRITER_AVAILABLE = find_spec("xlsxwriter") is not None
+
+# Rows written per batch by CSV exports
+EXPORT_CHUNK_SIZE = 100_000
 
 
 class DataProcessor:
     """Data processing and validation utilities"""
 
+    # Aggregation functions used when resampling, by column
+    _AGG_FUNCS = MappingProxyType(
+        {
+            "revenue": "sum",
+            "revenue_ma_7": "mean",
+            "revenue_ma_30": "mean",
+            "revenue_std_7": "mean",
+            "revenue_std_30": "mean",
+            "day_of_week": "first",
+            "is_weekend": "max",
+            "month": "first",
+            "day_of_month": "first",
+        }
+    )
+
     def __init__(self, config):
         self.config = config
         self.logger = logging.getLogger(__name__)
@@ -68,16 +94,11 @@ class DataProcessor:
                 validation_results["sufficient_data"] = True
 
             # Check for excessive gaps (more than 7 consecutive days with 0 revenue)
-            consecutive_zeros = (
-                (data["revenue"] == 0)
-                .astype(int)
-                .groupby((data["revenue"] != 0).cumsum())
-                .sum()
-            )
+            max_zero_run = self._max_zero_run(data["revenue"].to_numpy())
 
-            if consecutive_zeros.max() > 7:
+            if max_zero_run > 7:
                 self.logger.warning(
-                    f"Found {consecutive_zeros.max()} consecutive days with zero revenue"
+                    f"Found {max_zero_run} consecutive days with zero revenue"
                 )
             else:
                 validation_results["no_excessive_gaps"] = True
@@ -107,6 +128,17 @@ class DataProcessor:
             self.logger.error(f"Error in data validation: {e}")
             return validation_results
 
+    def _max_zero_run(self, revenue: np.ndarray) -> int:
+        """Length of the longest run of consecutive zero values"""
+
+        # Pad the zero mask with False so every run has a start and an end edge
+        mask = np.concatenate(([0], (revenue == 0).view(np.int8), [0]))
+        edges = np.flatnonzero(np.diff(mask))
+        if edges.size == 0:
+            return 0
+
+        return int((edges[1::2] - edges[::2]).max())
+
     def clean_data(self, data: pd.DataFrame) -> pd.DataFrame:
         """Clean and preprocess revenue data"""
 
@@ -114,14 +146,16 @@ class DataProcessor:
             if data.empty:
                 return data
 
-            # Create a copy to avoid modifying original
-            cleaned_data = data.copy()
+            # No upfront copy: every step below returns a new frame, so the
+            # original is never modified
+            cleaned_data = data
 
             # Ensure proper date index
             if not isinstance(cleaned_data.index, pd.DatetimeIndex):
                 if "date" in cleaned_data.columns:
-                    cleaned_data["date"] = pd.to_datetime(cleaned_data["date"])
-                    cleaned_data.set_index("date", inplace=True)
+                    cleaned_data = cleaned_data.assign(
+                        date=pd.to_datetime(cleaned_data["date"])
+                    ).set_index("date")
                 else:
                     self.logger.error("Cannot create date index - no date column found")
                     return data
@@ -129,30 +163,38 @@ class DataProcessor:
             # Sort by date
             cleaned_data = cleaned_data.sort_index()
 
-            # Remove duplicates (keep first occurrence)
-            cleaned_data = cleaned_data[~cleaned_data.index.duplicated(keep="first")]
+            # Remove duplicates (keep first occurrence); freshly fetched data has
+            # none, so only pay for positional de-duplication when needed
+            if not cleaned_data.index.is_unique:
+                _, first_positions = np.unique(
+                    cleaned_data.index.asi8, return_index=True
+                )
+                cleaned_data = cleaned_data.iloc[first_positions]
 
             # Handle missing values in revenue
             if "revenue" in cleaned_data.columns:
-                # Fill NaN values with 0
-                cleaned_data["revenue"] = cleaned_data["revenue"].fillna(0)
+                # Work on a private float copy of the values, cleaned in place
+                revenue = cleaned_data["revenue"].to_numpy(copy=True)
+                if not np.issubdtype(revenue.dtype, np.floating):
+                    revenue = revenue.astype(np.float64)
 
-                # Handle negative values (set to 0)
-                cleaned_data["revenue"] = cleaned_data["revenue"].clip(lower=0)
+                # Fill NaN values with 0 and set negative values to 0
+                np.nan_to_num(revenue, copy=False, nan=0.0)
+                np.maximum(revenue, 0, out=revenue)
 
                 # Handle extreme outliers (values > 10x the 95th percentile)
-                percentile_95 = cleaned_data["revenue"].quantile(0.95)
+                percentile_95 = self._quantile(revenue, 0.95)
                 outlier_threshold = percentile_95 * 10
 
-                outliers = cleaned_data["revenue"] > outlier_threshold
+                outliers = revenue > outlier_threshold
                 if outliers.any():
                     self.logger.warning(
                         f"Found {outliers.sum()} outliers, capping at ${outlier_threshold:.2f}"
                     )
-                    cleaned_data.loc[outliers, "revenue"] = outlier_threshold
+                    np.minimum(revenue, outlier_threshold, out=revenue)
 
-            # Add derived features
-            cleaned_data = self.add_derived_features(cleaned_data)
+                # Write the cleaned column back once
+                cleaned_data["revenue"] = revenue
 
             self.logger.info(f"Data cleaned: {len(cleaned_data)} records")
             return cleaned_data
@@ -161,6 +203,24 @@ class DataProcessor:
             self.logger.error(f"Error cleaning data: {e}")
             return data
 
+    def _quantile(self, values: np.ndarray, q: float) -> float:
+        """Linearly interpolated quantile using a partial sort instead of a full one"""
+
+        # Same interpolation as np.quantile, but only the two neighbouring order
+        # statistics are placed (introselect, O(n)) rather than sorting everything
+        position = q * (len(values) - 1)
+        lower = int(np.floor(position))
+        upper = min(lower + 1, len(values) - 1)
+
+        partitioned = np.partition(values, [lower, upper])
+        low_value = partitioned[lower]
+        return float(low_value + (partitioned[upper] - low_value) * (position - lower))
+
+    def prepare_for_model(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Clean revenue data and add the derived features used for modelling"""
+
+        return self.add_derived_features(self.clean_data(data))
+
     def add_derived_features(self, data: pd.DataFrame) -> pd.DataFrame:
         """Add derived features to the dataset"""
 
@@ -168,39 +228,73 @@ class DataProcessor:
             if data.empty or "revenue" not in data.columns:
                 return data
 
-            # Add day of week
-            data["day_of_week"] = data.index.dayofweek
-            data["is_weekend"] = data["day_of_week"].isin([5, 6]).astype(int)
+            # Build every feature column first and attach them in one step,
+            # instead of growing the frame one column at a time
+            features = {}
+
+            # Calendar features come from day/month counts since the epoch and
+            # are stored as 8-bit integers; derived revenue features as float32
+            index = data.index
+            if index.tz is not None:
+                index = index.tz_localize(None)
+            days = index.values.astype("datetime64[D]")
+            months = days.astype("datetime64[M]")
+
+            # Add day of week (1970-01-01 was a Thursday, Monday is 0)
+            day_of_week = ((days.view(np.int64) + 3) % 7).astype(np.int8)
+            features["day_of_week"] = day_of_week
+            features["is_weekend"] = (day_of_week >= 5).astype(np.uint8)
 
             # Add month and day of month
-            data["month"] = data.index.month
-            data["day_of_month"] = data.index.day
+            features["month"] = (months.view(np.int64) % 12 + 1).astype(np.int8)
+            features["day_of_month"] = (
+                (days - months.astype("datetime64[D]")).view(np.int64) + 1
+            ).astype(np.int8)
+
+            # Lag, change and cumulative features are computed from one NumPy
+            # array rather than through intermediate shifted Series
+            revenue = data["revenue"]
+            values = revenue.to_numpy(dtype=np.float64)
+
+            rolling_7 = revenue.rolling(window=7, min_periods=1)
+            rolling_30 = revenue.rolling(window=30, min_periods=1)
 
             # Add rolling averages
-            data["revenue_ma_7"] = (
-                data["revenue"].rolling(window=7, min_periods=1).mean()
-            )
-            data["revenue_ma_30"] = (
-                data["revenue"].rolling(window=30, min_periods=1).mean()
-            )
+            features["revenue_ma_7"] = rolling_7.mean().astype(np.float32)
+            features["revenue_ma_30"] = rolling_30.mean().astype(np.float32)
 
             # Add rolling standard deviations
-            data["revenue_std_7"] = (
-                data["revenue"].rolling(window=7, min_periods=1).std()
-            )
-            data["revenue_std_30"] = (
-                data["revenue"].rolling(window=30, min_periods=1).std()
-            )
+            features["revenue_std_7"] = rolling_7.std().astype(np.float32)
+            features["revenue_std_30"] = rolling_30.std().astype(np.float32)
 
             # Add lag features
-            data["revenue_lag_1"] = data["revenue"].shift(1)
-            data["revenue_lag_7"] = data["revenue"].shift(7)
+            for lag in (1, 7):
+                lagged = np.full(len(values), np.nan, dtype=np.float32)
+                if lag < len(values):
+                    lagged[lag:] = values[:-lag]
+                features[f"revenue_lag_{lag}"] = lagged
 
             # Add percentage change
-            data["revenue_pct_change"] = data["revenue"].pct_change()
-
-            # Add cumulative revenue
-            data["revenue_cumulative"] = data["revenue"].cumsum()
+            lag_1 = np.full(len(values), np.nan)
+            lag_1[1:] = values[:-1]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                features["revenue_pct_change"] = (values / lag_1 - 1).astype(np.float32)
+
+            # Add cumulative revenue (NaN days contribute nothing but stay NaN),
+            # kept in float64 so long running totals don't lose cents
+            cumulative = np.cumsum(np.nan_to_num(values))
+            cumulative[np.isnan(values)] = np.nan
+            features["revenue_cumulative"] = cumulative
+
+            # Replace (rather than duplicate) features already present, e.g. in
+            # previously exported data that is imported again
+            data = pd.concat(
+                [
+                    data.drop(columns=list(features), errors="ignore"),
+                    pd.DataFrame(features, index=data.index),
+                ],
+                axis=1,
+            )
 
             return data
 
@@ -215,24 +309,20 @@ class DataProcessor:
             if data.empty:
                 return data
 
-            # Define aggregation functions
-            agg_funcs = {
-                "revenue": "sum",
-                "revenue_ma_7": "mean",
-                "revenue_ma_30": "mean",
-                "revenue_std_7": "mean",
-                "revenue_std_30": "mean",
-                "day_of_week": "first",
-                "is_weekend": "max",
-                "month": "first",
-                "day_of_month": "first",
-            }
-
             # Only use functions for columns that exist
             existing_agg_funcs = {
-                col: func for col, func in agg_funcs.items() if col in data.columns
+                col: func
+                for col, func in self._AGG_FUNCS.items()
+                if col in data.columns
             }
 
+            # Data already at the target frequency has nothing to aggregate
+            if len(data) >= 3 and pd.infer_freq(data.index) == frequency:
+                self.logger.info(
+                    f"Data already at {frequency} frequency: {len(data)} records"
+                )
+                return data[list(existing_agg_funcs)].ffill()
+
             # Resample
             resampled = data.resample(frequency).agg(existing_agg_funcs)
 
@@ -293,21 +383,13 @@ class DataProcessor:
 
             # Revenue statistics
             if "revenue" in data.columns:
-                revenue_stats = {
-                    "total_revenue": data["revenue"].sum(),
-                    "average_daily_revenue": data["revenue"].mean(),
-                    "median_daily_revenue": data["revenue"].median(),
-                    "max_daily_revenue": data["revenue"].max(),
-                    "min_daily_revenue": data["revenue"].min(),
-                    "std_daily_revenue": data["revenue"].std(),
-                    "zero_revenue_days": (data["revenue"] == 0).sum(),
-                    "positive_revenue_days": (data["revenue"] > 0).sum(),
-                }
-                summary["revenue_stats"] = revenue_stats
+                summary["revenue_stats"] = self._revenue_stats(
+                    data["revenue"].to_numpy(dtype=np.float64)
+                )
 
             # Data quality metrics
             data_quality = {
-                "missing_values": data.isnull().sum().sum(),
+                "missing_values": self._count_missing(data),
                 "duplicate_dates": data.index.duplicated().sum(),
                 "negative_values": (
                     (data["revenue"] < 0).sum() if "revenue" in data.columns else 0
@@ -326,6 +408,44 @@ class DataProcessor:
             self.logger.error(f"Error getting data summary: {e}")
             return {}
 
+    def _revenue_stats(self, revenue: np.ndarray) -> Dict:
+        """Compute revenue statistics from one NaN-free copy of the values"""
+
+        # Like the pandas reductions, statistics skip missing values
+        values = revenue[~np.isnan(revenue)]
+        count = len(values)
+
+        total = float(values.sum())
+        mean = total / count if count else np.nan
+        if count > 1:
+            std = float(np.sqrt(np.dot(values - mean, values - mean) / (count - 1)))
+        else:
+            std = np.nan
+
+        return {
+            "total_revenue": total,
+            "average_daily_revenue": mean,
+            "median_daily_revenue": float(np.median(values)) if count else np.nan,
+            "max_daily_revenue": float(values.max()) if count else np.nan,
+            "min_daily_revenue": float(values.min()) if count else np.nan,
+            "std_daily_revenue": std,
+            "zero_revenue_days": int(np.count_nonzero(values == 0)),
+            "positive_revenue_days": int(np.count_nonzero(values > 0)),
+        }
+
+    def _count_missing(self, data: pd.DataFrame) -> int:
+        """Count missing values, scanning numeric columns as one 2D block"""
+
+        numeric = data.select_dtypes(include=[np.number])
+        missing = int(np.isnan(numeric.to_numpy(dtype=np.float64)).sum())
+
+        # Non-numeric columns (rare here) fall back to pandas' null detection
+        other_columns = data.columns.difference(numeric.columns)
+        if len(other_columns):
+            missing += int(data[other_columns].isna().to_numpy().sum())
+
+        return missing
+
     def _get_expected_days(self, start_date: datetime, end_date: datetime) -> int:
         """Calculate expected number of days between two dates"""
 
@@ -345,11 +465,13 @@ class DataProcessor:
                 return False
 
             if format.lower() == "csv":
-                data.to_csv(filepath)
+                data.to_csv(filepath, chunksize=EXPORT_CHUNK_SIZE)
             elif format.lower() == "json":
                 data.to_json(filepath, orient="index", date_format="iso")
-            elif format.lower() == "excel":
-                data.to_excel(filepath)
+            elif format.lower() in ("excel", "xlsx"):
+                data.to_excel(
+                    filepath, engine="xlsxwriter" if XLSXWRITER_AVAILABLE else None
+                )
             else:
                 self.logger.error(f"Unsupported export format: {format}")
                 return False
@@ -366,9 +488,18 @@ class DataProcessor:
 
         try:
             if format.lower() == "csv":
-                data = pd.read_csv(filepath, index_col=0, parse_dates=True)
+                if PYARROW_AVAILABLE:
+                    # Arrow's multithreaded parser infers ISO timestamps natively
+                    data = pd.read_csv(filepath, engine="pyarrow")
+                    data = data.set_index(data.columns[0])
+                    data.index = pd.to_datetime(data.index)
+                else:
+                    data = pd.read_csv(filepath, index_col=0, parse_dates=True)
             elif format.lower() == "json":
-                data = pd.read_json(filepath, orient="index")
+                with open(filepath, "rb") as f:
+                    data = pd.DataFrame.from_dict(
+                        orjson.loads(f.read()), orient="index"
+                    )
                 data.index = pd.to_datetime(data.index)
             elif format.lower() == "excel":
                 data = pd.read_excel(filepath, index_col=0, parse_dates=True)
@@ -3,26 +3,130 @@ SARIMA Forecasting Module
 Handles time series forecasting and backtesting for AdMob revenue data
 """
 
+import hashlib
 import logging
+import os
+import tempfile
 import warnings
-from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import pandas as pd
 import numpy as np
+import orjson
+from importlib.util import find_spec
+
+# statsmodels, scipy and statsforecast are slow to import, so they are loaded
+# on first use to keep application startup fast
+
+# Use statsforecast for a compiled order search when it is installed
+STATSFORECAST_AVAILABLE = find_spec("statsforecast") is not None
+
+
+def _suppress_warnings():
+    """Ignore all warnings, including categories statsmodels re-enables on import"""
+
+    warnings.filterwarnings("ignore")
 
-from statsmodels.tsa.statespace.sarimax import SARIMAX
-from statsmodels.tsa.seasonal import seasonal_decompose
-from statsmodels.tsa.stattools import adfuller, kpss
-from statsmodels.stats.diagnostic import acorr_ljungbox
-from sklearn.metrics import mean_absolute_error, mean_squared_error
 
 # Suppress warnings
-warnings.filterwarnings("ignore")
+_suppress_warnings()
+
+
+def _pad_params(params: np.ndarray, prev_p: int, p: int, q: int) -> np.ndarray:
+    """Reshape an ARMA(prev_p, .) parameter vector to ARMA(p, q), zero-filling"""
+
+    phi = np.zeros(p)
+    theta = np.zeros(q)
+    prev_theta = params[prev_p:]
+    phi[: min(p, prev_p)] = params[: min(p, prev_p)]
+    theta[: min(q, len(prev_theta))] = prev_theta[: min(q, len(prev_theta))]
+    return np.concatenate([phi, theta])
+
+
+def _css_fit(
+    y: np.ndarray, p: int, q: int, start_params: Optional[np.ndarray] = None
+) -> Tuple[float, Optional[np.ndarray]]:
+    """Fit ARMA(p, q) to y by conditional least squares, returning AIC and params"""
+
+    from scipy.optimize import minimize
+    from scipy.signal import lfilter
+
+    n = len(y)
+    k = p + q
+    if n <= k + 1:
+        return np.inf, None
+
+    def sum_of_squares(params):
+        # e[t] = y[t] - sum(phi * y[t-i]) - sum(theta * e[t-j]) as one IIR filter
+        residuals = lfilter(np.r_[1.0, -params[:p]], np.r_[1.0, params[p:]], y)
+        ssr = residuals @ residuals
+        return ssr if np.isfinite(ssr) else np.inf
+
+    params = np.zeros(k)
+    try:
+        if k:
+            result = minimize(
+                sum_of_squares,
+                params if start_params is None else start_params,
+                method="L-BFGS-B",
+                bounds=[(-0.99, 0.99)] * k,
+            )
+            ssr, params = result.fun, result.x
+        else:
+            ssr = y @ y
+    except Exception:
+        return np.inf, None
+
+    if not np.isfinite(ssr) or ssr <= 0:
+        return np.inf, None
+
+    # Concentrated Gaussian log-likelihood, counting sigma2 like SARIMAX does
+    llf = -0.5 * n * (np.log(2 * np.pi * ssr / n) + 1)
+    return -2 * llf + 2 * (k + 1), params
+
+
+def _ljung_box_pvalue(centered: np.ndarray, lags: int = 10) -> float:
+    """Ljung-Box p-value of demeaned residuals from one FFT autocorrelation pass"""
+
+    from scipy.stats import chi2
+
+    n = len(centered)
+
+    # Zero-pad to avoid circular wrap-around, then take the power spectrum
+    spectrum = np.fft.rfft(centered, n=2 * n)
+    autocov = np.fft.irfft(spectrum.real**2 + spectrum.imag**2)[: lags + 1]
+    acf = autocov[1:] / autocov[0]
+
+    q_stat = n * (n + 2) * np.sum(acf**2 / (n - np.arange(1, lags + 1)))
+    return float(chi2.sf(q_stat, lags))
+
+
+def _forecast_metrics(actual: np.ndarray, forecast: np.ndarray) -> Optional[Dict]:
+    """Compute MAE, MSE, RMSE and MAPE over points where both values exist"""
+
+    # A NaN on either side propagates into the error, so one mask covers both
+    errors = actual - forecast
+    valid = ~np.isnan(errors)
+    if not valid.all():
+        errors = errors[valid]
+        actual = actual[valid]
+
+    if len(errors) == 0:
+        return None
+
+    # Inputs may be float32, but accumulate the sums in float64
+    abs_errors = np.abs(errors)
+    mae = float(abs_errors.mean(dtype=np.float64))
+    mse = float(np.square(errors).mean(dtype=np.float64))
+    mape = float((abs_errors / (actual + 1e-8)).mean(dtype=np.float64) * 100)
+    return {"mae": mae, "mse": mse, "rmse": float(np.sqrt(mse)), "mape": mape}
 
 
 class SARIMAForecaster:
     """SARIMA model for forecasting AdMob revenue"""
 
+    # Number of auto-selected orders kept in the on-disk cache
+    ORDER_CACHE_SIZE = 128
+
     def __init__(self, config):
         self.config = config
         self.logger = logging.getLogger(__name__)
@@ -30,11 +134,49 @@ class SARIMAForecaster:
         self.fitted_model = None
         self.original_data = None
         self.forecast_results = None
+        self._validated_params = set()
+        self._start_params = {}
+        self.order_cache_file = config.get_cache_file("arima_orders", "json")
+        # Read from disk on first use, so forecasters that never auto-select an
+        # order, such as backtest and fold workers, don't parse the file
+        self._order_cache: Optional[Dict[str, List[int]]] = None
+
+    def _load_order_cache(self) -> Dict[str, List[int]]:
+        """Load ARIMA orders selected by previous runs"""
+
+        try:
+            with open(self.order_cache_file, "rb") as f:
+                return orjson.loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.logger.warning(f"Error loading ARIMA order cache: {e}")
+            return {}
+
+    def _save_order_cache(self):
+        """Persist selected ARIMA orders for the next run"""
+
+        try:
+            # Keep only the most recently added entries
+            while len(self._order_cache) > self.ORDER_CACHE_SIZE:
+                del self._order_cache[next(iter(self._order_cache))]
+
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=os.path.dirname(self.order_cache_file) or ".", delete=False
+            ) as f:
+                f.write(orjson.dumps(self._order_cache))
+            os.replace(f.name, self.order_cache_file)
+        except Exception as e:
+            self.logger.warning(f"Error saving ARIMA order cache: {e}")
 
     def prepare_data(self, data: pd.DataFrame) -> pd.DataFrame:
         """Prepare data for SARIMA modeling"""
 
         try:
+            # Slices of prepared data carry the flag, so backtest folds skip this
+            if data.attrs.get("admob_prepared", False):
+                return data
+
             # Ensure data is properly indexed by date
             if not isinstance(data.index, pd.DatetimeIndex):
                 data["date"] = pd.to_datetime(data["date"])
@@ -50,14 +192,14 @@ class SARIMAForecaster:
             if "revenue" not in data.columns:
                 raise ValueError("Data must contain a 'revenue' column")
 
-            # Handle missing values
-            data["revenue"] = data["revenue"].fillna(0)
-
-            # Handle negative values (set to 0)
-            data["revenue"] = data["revenue"].clip(lower=0)
-
-            # Add small constant to avoid zero values in log transformation
-            data["revenue"] = data["revenue"] + 1e-6
+            # Fill missing values, clip negatives to 0 and add a small constant
+            # to avoid zero values in log transformation, all on one buffer
+            revenue = data["revenue"].to_numpy(dtype=np.float64, copy=True)
+            np.nan_to_num(revenue, copy=False, nan=0.0)
+            np.maximum(revenue, 0.0, out=revenue)
+            revenue += 1e-6
+            data["revenue"] = revenue
+            data.attrs["admob_prepared"] = True
 
             self.logger.info(f"Prepared {len(data)} data points for forecasting")
             return data
@@ -69,6 +211,10 @@ class SARIMAForecaster:
     def check_stationarity(self, series: pd.Series) -> Dict[str, bool]:
         """Check if the time series is stationary"""
 
+        from statsmodels.tsa.stattools import adfuller, kpss
+
+        _suppress_warnings()
+
         try:
             results = {}
 
@@ -98,25 +244,46 @@ class SARIMAForecaster:
     def auto_arima_order(
         self, data: pd.Series, max_p: int = 3, max_d: int = 2, max_q: int = 3
     ) -> Tuple[int, int, int]:
-        """Automatically determine ARIMA order using AIC criterion"""
+        """Automatically determine ARIMA order using a stepwise AIC search"""
 
         try:
-            best_aic = np.inf
-            best_order = (1, 1, 1)
+            # Identical training data and bounds always select the same order
+            digest = hashlib.blake2b(
+                data.to_numpy(dtype=np.float64).tobytes(), digest_size=16
+            )
+            digest.update(bytes([max_p, max_d, max_q]))
+            cache_key = digest.hexdigest()
+            if self._order_cache is None:
+                self._order_cache = self._load_order_cache()
+            if cache_key in self._order_cache:
+                return tuple(self._order_cache[cache_key])
+
+            aics = {}
+            if STATSFORECAST_AVAILABLE and self.config.get(
+                "forecast_settings.use_statsforecast", True
+            ):
+                aics = self._statsforecast_search(data, max_p, max_d, max_q)
+
+            if not aics:
+                # Difference until the series looks stationary to fix d up front
+                d = 0
+                differenced = data
+                while (
+                    d < max_d
+                    and not self.check_stationarity(differenced)["is_stationary"]
+                ):
+                    differenced = differenced.diff().dropna()
+                    d += 1
+
+                p_hi, q_hi = self._significant_lags(differenced, max_p, max_q)
+                self._stepwise_search(data, d, p_hi, q_hi, aics)
 
-            for p in range(max_p + 1):
-                for d in range(max_d + 1):
-                    for q in range(max_q + 1):
-                        try:
-                            model = SARIMAX(
-                                data, order=(p, d, q), seasonal_order=(0, 0, 0, 0)
-                            )
-                            fitted = model.fit(disp=False)
-                            if fitted.aic < best_aic:
-                                best_aic = fitted.aic
-                                best_order = (p, d, q)
-                        except:
-                            continue
+            best_order = (1, 1, 1)
+            best_aic = min(aics.values())
+            if np.isfinite(best_aic):
+                best_order = min(aics, key=aics.get)
+                self._order_cache[cache_key] = list(best_order)
+                self._save_order_cache()
 
             self.logger.info(
                 f"Auto-selected ARIMA order: {best_order} (AIC: {best_aic:.2f})"
@@ -127,6 +294,105 @@ class SARIMAForecaster:
             self.logger.error(f"Error in auto ARIMA selection: {e}")
             return (1, 1, 1)
 
+    def _statsforecast_search(
+        self, data: pd.Series, max_p: int, max_d: int, max_q: int
+    ) -> Dict:
+        """Select a non-seasonal order with statsforecast's AutoARIMA"""
+
+        from statsforecast.models import AutoARIMA
+
+        try:
+            model = AutoARIMA(
+                max_p=max_p, max_d=max_d, max_q=max_q, seasonal=False, stepwise=True
+            ).fit(data.to_numpy(dtype=np.float64))
+
+            # arma is laid out as (p, q, P, Q, m, d, D)
+            p, q, _, _, _, d, _ = model.model_["arma"]
+            return {(int(p), int(d), int(q)): float(model.model_["aic"])}
+        except Exception as e:
+            self.logger.warning(f"statsforecast order search failed: {e}")
+            return {}
+
+    def _significant_lags(
+        self, series: pd.Series, max_p: int, max_q: int
+    ) -> Tuple[int, int]:
+        """Bound p and q by the last significant PACF and ACF lags"""
+
+        from statsmodels.tsa.stattools import acf, pacf
+
+        _suppress_warnings()
+
+        try:
+            values = series.to_numpy(dtype=np.float64)
+            n = len(values)
+            threshold = 1.96 / np.sqrt(n)
+
+            # Lag 0 is always 1, so only look at lags from 1 upwards
+            pacf_vals = np.abs(pacf(values, nlags=min(max_p, n // 2 - 1))[1:])
+            acf_vals = np.abs(acf(values, nlags=max_q, fft=True)[1:])
+
+            p_lags = np.flatnonzero(pacf_vals > threshold)
+            q_lags = np.flatnonzero(acf_vals > threshold)
+            p_hi = int(p_lags[-1]) + 1 if len(p_lags) else max_p
+            q_hi = int(q_lags[-1]) + 1 if len(q_lags) else max_q
+            return p_hi, q_hi
+
+        except Exception as e:
+            self.logger.warning(f"Error bounding ARIMA order: {e}")
+            return max_p, max_q
+
+    def _stepwise_search(
+        self, data: pd.Series, d: int, max_p: int, max_q: int, aics: Dict
+    ) -> Tuple[int, int, int]:
+        """Hyndman-Khandakar stepwise search over (p, q) for a fixed d"""
+
+        y = np.diff(data.to_numpy(dtype=np.float64), n=d)
+
+        params = {}
+
+        def evaluate(orders, start=None):
+            # Only fit candidates that have not been scored yet, warm-starting
+            # from the neighbour they were stepped from
+            for order in orders:
+                if order in aics:
+                    continue
+                start_params = None
+                if params.get(start) is not None:
+                    start_params = _pad_params(
+                        params[start], start[0], order[0], order[2]
+                    )
+                aics[order], params[order] = _css_fit(
+                    y, order[0], order[2], start_params
+                )
+
+        initial = list(
+            dict.fromkeys(
+                [
+                    (min(2, max_p), d, min(2, max_q)),
+                    (0, d, 0),
+                    (min(1, max_p), d, 0),
+                    (0, d, min(1, max_q)),
+                ]
+            )
+        )
+        evaluate(initial)
+        current = min(initial, key=aics.get)
+
+        while True:
+            p, _, q = current
+            neighbours = [
+                (p + dp, d, q + dq)
+                for dp in (-1, 0, 1)
+                for dq in (-1, 0, 1)
+                if (dp or dq) and 0 <= p + dp <= max_p and 0 <= q + dq <= max_q
+            ]
+            evaluate(neighbours, start=current)
+
+            best = min(neighbours, key=aics.get, default=current)
+            if aics[best] >= aics[current]:
+                return current
+            current = best
+
     def fit_model(
         self,
         data: pd.DataFrame,
@@ -135,13 +401,17 @@ class SARIMAForecaster:
     ) -> bool:
         """Fit SARIMA model to the data"""
 
+        from statsmodels.tsa.statespace.sarimax import SARIMAX
+
+        _suppress_warnings()
+
         try:
             # Prepare data
             prepared_data = self.prepare_data(data)
             revenue_series = prepared_data["revenue"]
 
-            # Store original data
-            self.original_data = prepared_data.copy()
+            # prepare_data already returns a new frame, so keep a reference
+            self.original_data = prepared_data
 
             # Use default parameters if not provided
             if order is None:
@@ -151,11 +421,18 @@ class SARIMAForecaster:
                     "forecast_settings.seasonal_order", [1, 1, 1, 7]
                 )
 
-            # Validate parameters
-            if not self.config.validate_sarima_parameters(order, seasonal_order):
-                self.logger.warning("Invalid SARIMA parameters, using auto-selection")
-                order = self.auto_arima_order(revenue_series)
-                seasonal_order = (1, 1, 1, 7)
+            # Validate parameters, remembering pairs that already passed
+            # (repr keeps list/tuple and int/float apart, as validation does)
+            params_key = (repr(order), repr(seasonal_order))
+            if params_key not in self._validated_params:
+                if self.config.validate_sarima_parameters(order, seasonal_order):
+                    self._validated_params.add(params_key)
+                else:
+                    self.logger.warning(
+                        "Invalid SARIMA parameters, using auto-selection"
+                    )
+                    order = self.auto_arima_order(revenue_series)
+                    seasonal_order = (1, 1, 1, 7)
 
             self.logger.info(
                 f"Fitting SARIMA model with order={order}, seasonal_order={seasonal_order}"
@@ -170,7 +447,13 @@ class SARIMAForecaster:
                 enforce_invertibility=False,
             )
 
-            self.fitted_model = self.model.fit(disp=False, maxiter=100)
+            # Warm-start from the last fit with the same orders, which converges
+            # in far fewer iterations when the data has only changed slightly
+            fit_key = (tuple(order), tuple(seasonal_order))
+            self.fitted_model = self.model.fit(
+                disp=False, maxiter=100, start_params=self._start_params.get(fit_key)
+            )
+            self._start_params[fit_key] = np.asarray(self.fitted_model.params)
 
             # Log model summary
             self.logger.info(
@@ -200,21 +483,19 @@ class SARIMAForecaster:
             # Create forecast dates
             last_date = self.original_data.index[-1]
             forecast_dates = pd.date_range(
-                start=last_date + timedelta(days=1), periods=steps, freq="D"
+                start=last_date + pd.Timedelta(days=1), periods=steps, freq="D"
             )
 
-            # Create forecast DataFrame
+            # Create forecast DataFrame directly on its date index
             forecast_df = pd.DataFrame(
                 {
-                    "date": forecast_dates,
-                    "forecast": forecast_values.values,
-                    "lower_ci": confidence_intervals.iloc[:, 0].values,
-                    "upper_ci": confidence_intervals.iloc[:, 1].values,
-                }
+                    "forecast": forecast_values.to_numpy(),
+                    "lower_ci": confidence_intervals.iloc[:, 0].to_numpy(),
+                    "upper_ci": confidence_intervals.iloc[:, 1].to_numpy(),
+                },
+                index=pd.DatetimeIndex(forecast_dates, name="date"),
             )
 
-            forecast_df.set_index("date", inplace=True)
-
             # Store forecast results
             self.forecast_results = forecast_df
 
@@ -225,73 +506,100 @@ class SARIMAForecaster:
             self.logger.error(f"Error generating forecast: {e}")
             return pd.DataFrame()
 
-    def backtest(self, data: pd.DataFrame, test_months: int = 3) -> Dict:
+    def _backtest_fold(self, train_data: pd.DataFrame, test_data: pd.DataFrame) -> Dict:
+        """Fit on one training window and score the forecast of its test window"""
+
+        # Fit model on training data
+        temp_forecaster = SARIMAForecaster(self.config)
+        temp_forecaster._validated_params = self._validated_params
+        temp_forecaster._start_params = self._start_params
+        if not temp_forecaster.fit_model(train_data):
+            raise ValueError("Failed to fit model for backtesting")
+
+        # Generate forecasts
+        forecast_df = temp_forecaster.forecast(len(test_data))
+
+        if forecast_df.empty:
+            raise ValueError("Failed to generate forecasts for backtesting")
+
+        # Align forecasts with actual data
+        forecast_df = forecast_df.reindex(test_data.index)
+
+        # Calculate metrics
+        metrics = _forecast_metrics(
+            test_data["revenue"].to_numpy(dtype=np.float32),
+            forecast_df["forecast"].to_numpy(dtype=np.float32),
+        )
+        if metrics is None:
+            raise ValueError("No valid data points for backtesting")
+
+        return {
+            "train_data": train_data,
+            "test_data": test_data,
+            "forecast_data": forecast_df,
+            "metrics": metrics,
+            "test_period": f"{test_data.index[0].strftime('%Y-%m-%d')} to {test_data.index[-1].strftime('%Y-%m-%d')}",
+        }
+
+    def backtest(
+        self,
+        data: pd.DataFrame,
+        test_months: int = 3,
+        n_folds: int = 1,
+        n_jobs: int = -1,
+    ) -> Dict:
         """Perform backtesting by excluding last N months and forecasting them"""
 
         try:
             # Prepare data
             prepared_data = self.prepare_data(data)
 
-            # Split data
+            # Split data into consecutive walk-forward test windows
             test_days = test_months * 30  # Approximate
-            train_data = prepared_data.iloc[:-test_days]
-            test_data = prepared_data.iloc[-test_days:]
+            cuts = [len(prepared_data) - i * test_days for i in range(n_folds, 0, -1)]
 
-            if len(train_data) < 30:
+            if cuts[0] < 30:
                 raise ValueError("Insufficient training data for backtesting")
 
             self.logger.info(
-                f"Backtesting: {len(train_data)} training days, {len(test_data)} test days"
+                f"Backtesting: {cuts[-1]} training days, {test_days} test days"
+                + (f", {n_folds} folds" if n_folds > 1 else "")
             )
 
-            # Fit model on training data
-            temp_forecaster = SARIMAForecaster(self.config)
-            if not temp_forecaster.fit_model(train_data):
-                raise ValueError("Failed to fit model for backtesting")
-
-            # Generate forecasts
-            forecast_df = temp_forecaster.forecast(len(test_data))
-
-            if forecast_df.empty:
-                raise ValueError("Failed to generate forecasts for backtesting")
-
-            # Align forecasts with actual data
-            forecast_df = forecast_df.reindex(test_data.index)
-
-            # Calculate metrics
-            actual_values = test_data["revenue"].values
-            forecast_values = forecast_df["forecast"].values
-
-            # Handle NaN values
-            valid_indices = ~(np.isnan(actual_values) | np.isnan(forecast_values))
-            actual_values = actual_values[valid_indices]
-            forecast_values = forecast_values[valid_indices]
-
-            if len(actual_values) == 0:
-                raise ValueError("No valid data points for backtesting")
-
-            # Calculate metrics
-            mae = mean_absolute_error(actual_values, forecast_values)
-            mse = mean_squared_error(actual_values, forecast_values)
-            rmse = np.sqrt(mse)
-            mape = (
-                np.mean(
-                    np.abs((actual_values - forecast_values) / (actual_values + 1e-8))
+            folds = [
+                (prepared_data.iloc[:cut], prepared_data.iloc[cut : cut + test_days])
+                for cut in cuts
+            ]
+
+            if n_folds == 1:
+                fold_results = [self._backtest_fold(*folds[0])]
+            else:
+                # joblib is only needed here, so load it on first use
+                from joblib import Parallel, delayed
+
+                # Folds share no state, so fit them in separate processes
+                fold_results = Parallel(n_jobs=n_jobs, prefer="processes")(
+                    delayed(_run_backtest_fold)(self.config, train_data, test_data)
+                    for train_data, test_data in folds
                 )
-                * 100
-            )
 
-            # Create backtest results
-            backtest_results = {
-                "train_data": train_data,
-                "test_data": test_data,
-                "forecast_data": forecast_df,
-                "metrics": {"mae": mae, "mse": mse, "rmse": rmse, "mape": mape},
-                "test_period": f"{test_data.index[0].strftime('%Y-%m-%d')} to {test_data.index[-1].strftime('%Y-%m-%d')}",
-            }
+            # The latest fold is the one shown; metrics average over all folds
+            backtest_results = fold_results[-1]
+            if n_folds > 1:
+                fold_metrics = pd.DataFrame(
+                    [
+                        {"test_period": fold["test_period"], **fold["metrics"]}
+                        for fold in fold_results
+                    ]
+                )
+                backtest_results["folds"] = fold_metrics
+                backtest_results["metrics"] = (
+                    fold_metrics.drop(columns="test_period").mean().to_dict()
+                )
 
+            metrics = backtest_results["metrics"]
             self.logger.info(
-                f"Backtesting completed. RMSE: {rmse:.2f}, MAE: {mae:.2f}, MAPE: {mape:.2f}%"
+                f"Backtesting completed. RMSE: {metrics['rmse']:.2f}, MAE: {metrics['mae']:.2f}, MAPE: {metrics['mape']:.2f}%"
             )
 
             return backtest_results
@@ -307,20 +615,23 @@ class SARIMAForecaster:
             if self.fitted_model is None:
                 return {}
 
-            # Get residuals
-            residuals = self.fitted_model.resid
+            # Get residuals and center them once for every statistic below
+            residuals = np.asarray(self.fitted_model.resid, dtype=np.float64)
+            residual_mean = residuals.mean()
+            centered = residuals - residual_mean
+            residual_std = np.sqrt(centered @ centered / (len(centered) - 1))
 
             # Ljung-Box test for residual autocorrelation
-            lb_test = acorr_ljungbox(residuals, lags=10, return_df=True)
+            ljung_box_p_value = _ljung_box_pvalue(centered)
 
             # Basic statistics
             diagnostics = {
                 "aic": self.fitted_model.aic,
                 "bic": self.fitted_model.bic,
                 "log_likelihood": self.fitted_model.llf,
-                "residual_mean": residuals.mean(),
-                "residual_std": residuals.std(),
-                "ljung_box_p_value": lb_test["lb_pvalue"].iloc[-1],
+                "residual_mean": residual_mean,
+                "residual_std": residual_std,
+                "ljung_box_p_value": ljung_box_p_value,
                 "model_order": self.fitted_model.model.order,
                 "seasonal_order": self.fitted_model.model.seasonal_order,
             }
@@ -331,26 +642,40 @@ class SARIMAForecaster:
             self.logger.error(f"Error getting model diagnostics: {e}")
             return {}
 
-    def seasonal_decomposition(self, data: pd.DataFrame) -> pd.DataFrame:
+    def seasonal_decomposition(
+        self, data: pd.DataFrame, use_stl: bool = False
+    ) -> pd.DataFrame:
         """Perform seasonal decomposition of the time series"""
 
+        from statsmodels.tsa.seasonal import STL, seasonal_decompose
+
+        _suppress_warnings()
+
         try:
             prepared_data = self.prepare_data(data)
             revenue_series = prepared_data["revenue"]
+            values = revenue_series.to_numpy(dtype=np.float64)
+
+            # Classical moving-average decomposition by default; STL on request
+            # is linear in the series length and leaves no NaN edges
+            if use_stl:
+                decomposition = STL(values, period=7).fit()  # Weekly seasonality
+            else:
+                decomposition = seasonal_decompose(
+                    values, model="additive", period=7  # Weekly seasonality
+                )
 
-            # Perform seasonal decomposition
-            decomposition = seasonal_decompose(
-                revenue_series, model="additive", period=7  # Weekly seasonality
-            )
+            # Fill one 2-D block so the DataFrame wraps it without per-column copies
+            block = np.empty((len(values), 4))
+            block[:, 0] = values
+            block[:, 1] = decomposition.trend
+            block[:, 2] = decomposition.seasonal
+            block[:, 3] = decomposition.resid
 
-            # Create decomposition DataFrame
             decomp_df = pd.DataFrame(
-                {
-                    "original": revenue_series,
-                    "trend": decomposition.trend,
-                    "seasonal": decomposition.seasonal,
-                    "residual": decomposition.resid,
-                }
+                block,
+                index=revenue_series.index,
+                columns=["original", "trend", "seasonal", "residual"],
             )
 
             return decomp_df
@@ -366,16 +691,19 @@ class SARIMAForecaster:
             if self.fitted_model is None:
                 return {}
 
-            # Get model parameters
-            params = self.fitted_model.params
-
-            # Create feature importance dictionary
-            importance = {}
-            for i, param in enumerate(params):
-                importance[f"parameter_{i}"] = abs(param)
-
-            return importance
+            # Key parameter magnitudes by their names, e.g. "ar.L1" or "ma.S.L7"
+            names = self.fitted_model.model.param_names
+            magnitudes = np.abs(np.asarray(self.fitted_model.params))
+            return dict(zip(names, magnitudes.tolist()))
 
         except Exception as e:
             self.logger.error(f"Error getting feature importance: {e}")
             return {}
+
+
+def _run_backtest_fold(
+    config, train_data: pd.DataFrame, test_data: pd.DataFrame
+) -> Dict:
+    """Run one backtest fold in a fresh forecaster, for worker processes"""
+
+    return SARIMAForecaster(config)._backtest_fold(train_data, test_data)
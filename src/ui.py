@@ -4,11 +4,15 @@ PyQt6 interface for the AdMob Revenue Forecaster
 """
 
 import sys
+import time
+import shutil
+import functools
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-import pandas as pd
+from typing import Dict, List, Optional, Tuple
 import numpy as np
+import orjson
+import pandas as pd
 
 from PyQt6.QtWidgets import (
     QMainWindow,
@@ -35,7 +39,17 @@ from PyQt6.QtWidgets import (
     QMenuBar,
     QScrollArea,
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QDate
+from PyQt6.QtCore import (
+    Qt,
+    QObject,
+    QRunnable,
+    QThread,
+    QThreadPool,
+    pyqtSignal,
+    QTimer,
+    QDate,
+    QUrl,
+)
 from PyQt6.QtGui import QFont, QIcon, QAction
 
 # Try to import QWebEngineView, fall back to QTextEdit if not available
@@ -47,15 +61,115 @@ except ImportError:
     WEB_ENGINE_AVAILABLE = False
     QWebEngineView = None
 
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import plotly.offline as pyo
+# Plotly is imported where the charts are built, keeping it off the
+# application's startup path until the first chart is shown
 
 from admob_api import AdMobAPIClient
 from forecasting import SARIMAForecaster
 from data_processor import DataProcessor
 
 
+# Label stylesheets, shared so each distinct style string exists once
+_STYLE_MUTED = "QLabel { color: #888; font-size: 12px; }"
+_STYLE_OK = "QLabel { color: #28a745; font-size: 12px; }"
+_STYLE_ERROR = "QLabel { color: #dc3545; font-size: 12px; }"
+_STYLE_WARNING = "QLabel { color: #ff8c00; font-size: 12px; }"
+_STYLE_RATE_OK = "QLabel { color: #28a745; font-size: 12px; font-weight: bold; }"
+_STYLE_RATE_MISSING = "QLabel { color: #dc3545; font-size: 12px; font-style: italic; }"
+_STYLE_CREDENTIALS_OK = "QLabel { color: #28a745; font-weight: bold; }"
+_STYLE_CREDENTIALS_MISSING = "QLabel { color: #888; font-style: italic; }"
+
+
+# Plotly options for the revenue chart
+_CHART_CONFIG = {
+    "displayModeBar": True,
+    "displaylogo": False,
+    "responsive": True,
+    "modeBarButtonsToRemove": ["toImage", "downloadPlot"],
+}
+_CHART_CONFIG_JSON = orjson.dumps(_CHART_CONFIG).decode()
+
+# Layout shared by the empty and the revenue chart
+_CHART_LAYOUT = {
+    "title": "AdMob Revenue Forecast",
+    "xaxis_title": "Date",
+    "yaxis_title": "Revenue (USD)",
+    "template": "plotly_dark",
+    "paper_bgcolor": "black",  # Black background
+    "plot_bgcolor": "black",  # Black plot area
+}
+
+# Revenue chart layout, with the y-axis starting from 0
+_REVENUE_CHART_LAYOUT = {
+    **_CHART_LAYOUT,
+    "yaxis_rangemode": "tozero",
+    "hovermode": "x unified",
+    "showlegend": True,
+    "legend": {
+        "orientation": "h",
+        "yanchor": "bottom",
+        "y": 1.02,
+        "xanchor": "right",
+        "x": 1,
+    },
+}
+
+# Page the chart is drawn into; plotly.js is loaded from a sibling file once
+# and every redraw only sends the figure JSON to Plotly.react
+_CHART_PAGE_HTML = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<style>
+html, body {
+    margin: 0 !important;
+    padding: 0 !important;
+    width: 100% !important;
+    height: 100% !important;
+    background: black !important;
+}
+#plotly-chart {
+    margin: 0 !important;
+    padding: 0 !important;
+    width: 100% !important;
+    height: 100% !important;
+}
+</style>
+<script src="plotly.min.js"></script>
+</head>
+<body>
+<div id="plotly-chart"></div>
+</body>
+</html>
+"""
+
+
+# Text shown in place of the chart when PyQt6-WebEngine is missing
+_NO_WEB_ENGINE_HTML = """
+<h2>Web Engine Not Available</h2>
+<p>PyQt6-WebEngine is not installed. Interactive charts are not available.</p>
+<p>To enable interactive charts, install PyQt6-WebEngine:</p>
+<pre>pip install PyQt6-WebEngine</pre>
+<p>Chart data will be displayed as text when available.</p>
+"""
+_EMPTY_FALLBACK_HTML = """
+<h2>AdMob Revenue Forecast</h2>
+<p><strong>Status:</strong> No data available</p>
+<p>Please fetch data and run forecast to see results.</p>
+<p><em>Note: Interactive charts require PyQt6-WebEngine installation.</em></p>
+"""
+
+
+def _figure_js(fig) -> str:
+    """Build the script that draws a figure on the chart page"""
+
+    return (
+        f"var fig = {fig.to_json()};"
+        "Plotly.react('plotly-chart', fig.data, fig.layout, "
+        f"{_CHART_CONFIG_JSON});"
+    )
+
+
 def create_table(title, content):
     """Create a table with the given title and content"""
 
@@ -67,88 +181,306 @@ def create_table(title, content):
 """
 
 
+# Shared cell markup, built once instead of on every cell
+_CELL_STYLE = "padding: 8px; border: 1px solid white; text-align: left;"
+_TH_OPEN = f"<th style='{_CELL_STYLE}'>"
+_TD_OPEN = f"<td style='{_CELL_STYLE}'>"
+
+
 def create_th(text):
     """Create a table header cell with the given text"""
 
-    return f"<th style='padding: 8px; border: 1px solid white; text-align: left;'>{text}</th>"
+    return f"{_TH_OPEN}{text}</th>"
 
 
 def create_td(text):
     """Create a table data cell with the given text"""
 
-    return f"<td style='padding: 8px; border: 1px solid white; text-align: left;'>{text}</td>"
+    return f"{_TD_OPEN}{text}</td>"
+
+
+def create_rows(rows):
+    """Create table rows from (header, cell, ...) tuples in a single join"""
+
+    return "".join(
+        f"<tr>{_TH_OPEN}{header}</th>"
+        + "".join(f"{_TD_OPEN}{cell}</td>" for cell in cells)
+        + "</tr>\n"
+        for header, *cells in rows
+    )
+
+
+def format_numeric(value, default="N/A"):
+    """Safely format numeric values"""
+
+    if value is None or value == "N/A":
+        return default
+    try:
+        return f"{float(value):.2f}"
+    except (ValueError, TypeError):
+        return default
+
+
+def _make_spin(
+    minimum: int, maximum: int, value: int, suffix: Optional[str] = None
+) -> QSpinBox:
+    """Create a QSpinBox with its range, value and optional suffix set"""
+
+    spin = QSpinBox()
+    spin.setRange(minimum, maximum)
+    spin.setValue(value)
+    if suffix:
+        spin.setSuffix(suffix)
+    return spin
+
+
+def _to_qdate(value) -> QDate:
+    """Convert a date or datetime to a QDate without a string round trip"""
+
+    return QDate(value.year, value.month, value.day)
+
+
+def _convert_and_cum(revenue, rate, start=0.0, cumulative=None):
+    """Get the running total of a daily revenue array and its local-currency
+    conversion in one place, as (cumulative, (daily_local, cumulative_local)).
+    The conversion is None when there is no exchange rate."""
+
+    if cumulative is None:
+        cumulative = np.cumsum(revenue)
+        if start:
+            cumulative += start
+    if rate is None:
+        return cumulative, None
+    return cumulative, (revenue * rate, cumulative * rate)
+
+
+def _prepare_data(data_processor, data: pd.DataFrame) -> pd.DataFrame:
+    """Clean fetched or imported data and add its running revenue total"""
+
+    data = data_processor.clean_data(data)
+
+    # Store the running total once so chart redraws just read it, summed in
+    # float64 so long running totals don't lose cents
+    if "revenue" in data.columns:
+        data = data.assign(
+            revenue_cumulative=np.cumsum(data["revenue"].to_numpy(), dtype=np.float64)
+        )
+    return data
+
+
+@functools.lru_cache(maxsize=32)
+def _hover_template(label: str, local_currency: Optional[str]) -> str:
+    """Build (and memoize) the hover template for a revenue line, showing
+    local currency amounts next to USD unless local_currency is None"""
+
+    if local_currency is None:
+        return (
+            "<b>%{x}</b><br>"
+            + f"{label}: %{{y:,.2f}} USD<br>"
+            + "Cumulative Revenue: %{customdata:,.2f} USD<br>"
+            + "<extra></extra>"
+        )
+
+    return (
+        "<b>%{x}</b><br>"
+        + f"{label}: %{{y:,.2f}} USD (%{{customdata[0]:,.2f}} {local_currency})<br>"
+        + f"Cumulative Revenue: %{{customdata[1]:,.2f}} USD (%{{customdata[2]:,.2f}} {local_currency})<br>"
+        + "<extra></extra>"
+    )
+
+
+# Most points sent to the chart per line; longer lines are downsampled
+_MAX_TRACE_POINTS = 2000
+
+
+def _lttb_indices(values, n_out):
+    """Pick positions of n_out points that keep the shape of a line, using
+    Largest-Triangle-Three-Buckets. Returns None if the line is short enough."""
+
+    n = len(values)
+    if n <= n_out or n_out < 3:
+        return None
+
+    y = np.nan_to_num(np.asarray(values, dtype=np.float64))
+    x = np.arange(n, dtype=np.float64)
+
+    # First and last points are kept, the rest is split into equal buckets
+    every = (n - 2) / (n_out - 2)
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+
+        # Keep the point forming the largest triangle with the previously
+        # kept point and the average of the next bucket
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(area.argmax())
+        selected[i + 1] = a
+
+    return selected
+
+
+def _worker_pool() -> QThreadPool:
+    """Get the shared pool that runs data fetching and forecasting jobs"""
+
+    pool = QThreadPool.globalInstance()
+    # Leave room to fetch data while a forecast is running, even on one core
+    if pool.maxThreadCount() < 2:
+        pool.setMaxThreadCount(2)
+    return pool
+
+
+class ThrottledProgress:
+    """Forward progress values to a signal at most once per interval"""
+
+    def __init__(self, signal, interval: float = 0.05):
+        self.signal = signal
+        self.interval = interval
+        self._last_emit: Optional[float] = None
 
+    def post(self, value: int):
+        """Emit a progress value unless one was emitted too recently"""
 
-class DataFetchingThread(QThread):
-    """Background thread for fetching data from AdMob API"""
+        now = time.monotonic()
+        # Completion always goes through so the bar never stalls short of done
+        if (
+            value < 100
+            and self._last_emit is not None
+            and now - self._last_emit < self.interval
+        ):
+            return
+
+        self._last_emit = now
+        self.signal.emit(value)
+
+
+class DataFetchingSignals(QObject):
+    """Signals emitted by a DataFetchingRunnable or DataImportRunnable"""
 
     progress_update = pyqtSignal(int)
     status_update = pyqtSignal(str)
-    data_ready = pyqtSignal(pd.DataFrame)
+    # The fetched frame is left in result; only the notification crosses threads
+    data_ready = pyqtSignal()
     error_occurred = pyqtSignal(str)
 
-    def __init__(self, api_client, start_date, end_date):
+    def __init__(self):
+        super().__init__()
+        self.result: Optional[pd.DataFrame] = None
+
+
+class DataFetchingRunnable(QRunnable):
+    """Background job for fetching data from AdMob API"""
+
+    def __init__(self, api_client, data_processor, start_date, end_date):
         super().__init__()
+        self.signals = DataFetchingSignals()
+        self._progress = ThrottledProgress(self.signals.progress_update)
         self.api_client = api_client
+        self.data_processor = data_processor
         self.start_date = start_date
         self.end_date = end_date
 
     def run(self):
         try:
-            self.progress_update.emit(10)
-            self.status_update.emit("Authenticating with AdMob API...")
-
-            # Check if authentication succeeds
-            if not self.api_client.authenticate():
-                self.error_occurred.emit(
-                    "Authentication failed. Please check your OAuth2 credentials and try again."
-                )
-                return
+            # A client reused from an earlier fetch can skip the OAuth2 handshake
+            if not self.api_client.is_authenticated():
+                self._progress.post(10)
+                self.signals.status_update.emit("Authenticating with AdMob API...")
+
+                # Check if authentication succeeds
+                if not self.api_client.authenticate():
+                    self.signals.error_occurred.emit(
+                        "Authentication failed. Please check your OAuth2 credentials and try again."
+                    )
+                    return
 
-            self.progress_update.emit(30)
-            self.status_update.emit("Fetching revenue data...")
+            self._progress.post(30)
+            self.signals.status_update.emit("Fetching revenue data...")
 
             # Fetch data
             data = self.api_client.fetch_revenue_data(
-                self.start_date, self.end_date, use_cache=True
+                self.start_date.isoformat(), self.end_date.isoformat(), use_cache=True
             )
 
-            self.progress_update.emit(100)
+            self._progress.post(100)
 
             if data.empty:
-                self.error_occurred.emit(
+                self.signals.error_occurred.emit(
                     "No data retrieved from AdMob API. Please check your date range and account access."
                 )
             else:
-                self.status_update.emit(
+                self.signals.status_update.emit(
                     f"Successfully fetched {len(data)} days of data"
                 )
-                self.data_ready.emit(data)
+                # Clean here so the GUI thread receives ready-to-use data
+                self.signals.result = _prepare_data(self.data_processor, data)
+                self.signals.data_ready.emit()
 
         except Exception as e:
             error_msg = str(e)
             if "authentication" in error_msg.lower():
-                self.error_occurred.emit(f"Authentication error: {error_msg}")
+                self.signals.error_occurred.emit(f"Authentication error: {error_msg}")
             elif "403" in error_msg or "permission" in error_msg.lower():
-                self.error_occurred.emit(
+                self.signals.error_occurred.emit(
                     f"Permission error: {error_msg}. Please check your AdMob account access."
                 )
             else:
-                self.error_occurred.emit(f"Error fetching data: {error_msg}")
+                self.signals.error_occurred.emit(f"Error fetching data: {error_msg}")
 
 
-class ForecastingThread(QThread):
-    """Background thread for running forecasting models"""
+class DataImportRunnable(QRunnable):
+    """Background job for reading and cleaning an imported data file"""
+
+    def __init__(self, data_processor, file_path, file_format):
+        super().__init__()
+        self.signals = DataFetchingSignals()
+        self.data_processor = data_processor
+        self.file_path = file_path
+        self.file_format = file_format
+
+    def run(self):
+        try:
+            data = self.data_processor.import_data(self.file_path, self.file_format)
+
+            if data.empty:
+                self.signals.error_occurred.emit("Failed to import data.")
+                return
+
+            self.signals.result = _prepare_data(self.data_processor, data)
+            self.signals.data_ready.emit()
+
+        except Exception as e:
+            self.signals.error_occurred.emit(f"Import failed: {str(e)}")
+
+
+class ForecastingSignals(QObject):
+    """Signals emitted by a ForecastingRunnable"""
 
     progress_update = pyqtSignal(int)
     status_update = pyqtSignal(str)
     forecast_ready = pyqtSignal(pd.DataFrame, dict)
     error_occurred = pyqtSignal(str)
 
+
+class ForecastingRunnable(QRunnable):
+    """Background job for running forecasting models"""
+
     def __init__(
         self, data, config, forecast_days, run_backtest=True, backtest_days=90
     ):
         super().__init__()
+        self.signals = ForecastingSignals()
+        self._progress = ThrottledProgress(self.signals.progress_update)
         self.data = data
         self.config = config
         self.forecast_days = forecast_days
@@ -157,20 +489,20 @@ class ForecastingThread(QThread):
 
     def run(self):
         try:
-            self.progress_update.emit(10)
-            self.status_update.emit("Preparing data for forecasting...")
+            self._progress.post(10)
+            self.signals.status_update.emit("Preparing data for forecasting...")
 
             forecaster = SARIMAForecaster(self.config)
 
-            self.progress_update.emit(30)
-            self.status_update.emit("Fitting SARIMA model...")
+            self._progress.post(30)
+            self.signals.status_update.emit("Fitting SARIMA model...")
 
             if not forecaster.fit_model(self.data):
-                self.error_occurred.emit("Failed to fit SARIMA model")
+                self.signals.error_occurred.emit("Failed to fit SARIMA model")
                 return
 
-            self.progress_update.emit(60)
-            self.status_update.emit("Generating forecasts...")
+            self._progress.post(60)
+            self.signals.status_update.emit("Generating forecasts...")
 
             forecast_data = forecaster.forecast(self.forecast_days)
 
@@ -180,8 +512,8 @@ class ForecastingThread(QThread):
             }
 
             if self.run_backtest:
-                self.progress_update.emit(80)
-                self.status_update.emit("Running backtest...")
+                self._progress.post(80)
+                self.signals.status_update.emit("Running backtest...")
 
                 # Convert backtest days to months (approximately)
                 test_months = max(1, self.backtest_days // 30)
@@ -190,25 +522,259 @@ class ForecastingThread(QThread):
                 )
                 results["backtest"] = backtest_results
 
-            self.progress_update.emit(100)
-            self.status_update.emit("Forecasting completed successfully")
+            self._progress.post(100)
+            self.signals.status_update.emit("Forecasting completed successfully")
 
-            self.forecast_ready.emit(forecast_data, results)
+            self.signals.forecast_ready.emit(forecast_data, results)
 
         except Exception as e:
-            self.error_occurred.emit(f"Error in forecasting: {str(e)}")
+            self.signals.error_occurred.emit(f"Error in forecasting: {str(e)}")
+
+
+class SummaryRenderThread(QThread):
+    """Background thread for building the data summary HTML"""
+
+    html_ready = pyqtSignal(str)
+
+    def __init__(self, data, data_processor, currency_formatter):
+        super().__init__()
+        self.data = data
+        self.data_processor = data_processor
+        self.currency_formatter = currency_formatter
+
+    def run(self):
+        try:
+            summary = self.data_processor.get_data_summary(self.data)
+
+            # Format the currency values shown in the table in one pass, so
+            # the exchange rate is resolved once rather than per amount
+            revenue_stats = summary.get("revenue_stats") or {}
+            money_keys = (
+                "total_revenue",
+                "average_daily_revenue",
+                "max_daily_revenue",
+                "min_daily_revenue",
+            )
+            money = dict(
+                zip(
+                    money_keys,
+                    self.currency_formatter.format_currency_series(
+                        np.array([revenue_stats.get(key, 0) for key in money_keys])
+                    ),
+                )
+            )
+
+            date_range = summary.get("date_range") or {}
+            data_quality = summary.get("data_quality") or {}
+
+            data_summary_text = create_table(
+                "Data Summary",
+                create_rows(
+                    [
+                        (
+                            "Date Range",
+                            date_range.get("start", "N/A")
+                            + " to "
+                            + date_range.get("end", "N/A"),
+                            "Date range of the data",
+                        ),
+                        (
+                            "Total Days",
+                            str(summary.get("total_records", 0)),
+                            "Total number of days in the data",
+                        ),
+                        (
+                            "Total Revenue",
+                            money["total_revenue"],
+                            "Total revenue from the data",
+                        ),
+                        (
+                            "Average Daily",
+                            money["average_daily_revenue"],
+                            "Average daily revenue from the data",
+                        ),
+                        (
+                            "Highest Day",
+                            money["max_daily_revenue"],
+                            "Highest daily revenue from the data",
+                        ),
+                        (
+                            "Lowest Day",
+                            money["min_daily_revenue"],
+                            "Lowest daily revenue from the data",
+                        ),
+                        (
+                            "Zero Revenue Days",
+                            str(revenue_stats.get("zero_revenue_days", 0)),
+                            "Number of days with zero revenue",
+                        ),
+                    ]
+                ),
+            )
+
+            data_quality_text = create_table(
+                "Data Quality",
+                create_rows(
+                    [
+                        (
+                            "Missing Values",
+                            str(data_quality.get("missing_values", 0)),
+                            "Number of missing values in the data",
+                        ),
+                        (
+                            "Duplicates",
+                            str(data_quality.get("duplicate_dates", 0)),
+                            "Number of duplicate rows in the data",
+                        ),
+                        (
+                            "Completeness",
+                            str(round(data_quality.get("completeness_pct", 0), 1))
+                            + "%",
+                            "Percentage of complete data",
+                        ),
+                    ]
+                ),
+            )
+
+            html = f"""
+{data_summary_text}
+<br>
+{data_quality_text}
+"""
+            self.html_ready.emit(html)
+
+        except Exception as e:
+            logging.error(f"Error updating data summary: {e}")
+            self.html_ready.emit(f"Error updating summary: {str(e)}")
+
+
+class RateFetchThread(QThread):
+    """Background thread for looking up the USD exchange rate of a currency"""
+
+    # Emits the currency code and its rate, or None if it is not available
+    rate_ready = pyqtSignal(str, object)
+
+    def __init__(self, currency_formatter, currency):
+        super().__init__()
+        self.currency_formatter = currency_formatter
+        self.currency = currency
+
+    def run(self):
+        try:
+            rate = self.currency_formatter.get_current_exchange_rate(self.currency)
+        except Exception as e:
+            logging.error(f"Error fetching exchange rate: {str(e)}")
+            rate = None
+
+        self.rate_ready.emit(self.currency, rate)
+
+
+class ExportThread(QThread):
+    """Background thread for writing the current data to a file"""
+
+    # Emits whether the export succeeded
+    export_done = pyqtSignal(bool)
+
+    def __init__(self, data, data_processor, file_path, file_format):
+        super().__init__()
+        self.data = data
+        self.data_processor = data_processor
+        self.file_path = file_path
+        self.file_format = file_format
+
+    def run(self):
+        success = self.data_processor.export_data(
+            self.data, self.file_path, self.file_format
+        )
+        self.export_done.emit(success)
+
+
+class CredentialsUploadThread(QThread):
+    """Background thread for validating and copying an OAuth2 credentials file"""
+
+    success = pyqtSignal()
+    # Emits the title and text of the warning to show
+    failure = pyqtSignal(str, str)
+
+    def __init__(self, file_path, target_path):
+        super().__init__()
+        self.file_path = file_path
+        self.target_path = target_path
+
+    def run(self):
+        try:
+            # Validate JSON file first
+            with open(self.file_path, "rb") as f:
+                credentials = orjson.loads(f.read())
+
+            # Client info sits under "installed" or "web", or at the top level
+            client_info = (
+                credentials.get("installed") or credentials.get("web") or credentials
+                if isinstance(credentials, dict)
+                else {}
+            )
+            is_valid = (
+                isinstance(client_info, dict)
+                and "client_id" in client_info
+                and "client_secret" in client_info
+            )
+
+            if not is_valid:
+                self.failure.emit(
+                    "Invalid Credentials File",
+                    "The selected file does not appear to be a valid OAuth2 credentials JSON file.\n\n"
+                    "Please ensure you downloaded the correct file from Google Cloud Console.",
+                )
+                return
+
+            # Copy file to app directory
+            shutil.copy2(self.file_path, self.target_path)
+
+            self.success.emit()
+
+        except Exception as e:
+            self.failure.emit(
+                "Upload Error",
+                f"Could not upload credentials file: {str(e)}\n\n"
+                "Please ensure the file is a valid OAuth2 credentials JSON file.",
+            )
 
 
 class SettingsTab(QWidget):
     """Settings tab for API configuration and application settings"""
 
+    # Seconds for which a looked-up exchange rate is shown without refetching
+    RATE_CACHE_TTL = 600
+
     def __init__(self, config, currency_formatter):
         super().__init__()
         self.config = config
         self.currency_formatter = currency_formatter
+
+        # Exchange rates by currency as (rate, lookup time), and running lookups
+        self._rate_cache: Dict[str, Tuple[float, float]] = {}
+        self._rate_threads: Dict[str, RateFetchThread] = {}
+        self.credentials_thread = None
+
+        # Coalesce rapid auto-saves (e.g. stepping through the currency list);
+        # only the settings that triggered them are written
+        self._pending_settings: Dict[str, object] = {}
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(self._auto_save)
+
         self.init_ui()
 
     def init_ui(self):
+        # Suspend updates while the form rows are added, then lay out once
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_ui()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _build_ui(self):
         layout = QVBoxLayout()
         layout.setSpacing(20)
 
@@ -228,17 +794,17 @@ class SettingsTab(QWidget):
 6. Test the connection
         """
         )
+        # The text is known to be HTML, skip rich text auto-detection
+        instructions_label.setTextFormat(Qt.TextFormat.RichText)
         instructions_label.setWordWrap(True)
         instructions_label.setOpenExternalLinks(True)
-        instructions_label.setStyleSheet("QLabel { font-size: 12px; color: #888; }")
+        instructions_label.setStyleSheet(_STYLE_MUTED)
         api_layout.addRow("", instructions_label)
 
         # OAuth2 Credentials File Upload
         credentials_layout = QHBoxLayout()
         self.credentials_status_label = QLabel("No credentials file uploaded")
-        self.credentials_status_label.setStyleSheet(
-            "QLabel { color: #888; font-style: italic; }"
-        )
+        self.credentials_status_label.setStyleSheet(_STYLE_CREDENTIALS_MISSING)
         self.upload_credentials_btn = QPushButton("Upload OAuth2 JSON File")
         self.upload_credentials_btn.clicked.connect(self.upload_credentials_file)
         credentials_layout.addWidget(self.credentials_status_label)
@@ -266,26 +832,24 @@ class SettingsTab(QWidget):
         if report_type_index >= 0:
             self.report_type_combo.setCurrentIndex(report_type_index)
 
-        # Connect report type change to clear cache
-        self.report_type_combo.currentTextChanged.connect(self.on_report_type_changed)
+        # Connect report type change to clear cache; activated only fires when
+        # the user commits a selection
+        self._last_committed_report_type = current_report_type
+        self.report_type_combo.activated.connect(self.on_report_type_changed)
 
         api_layout.addRow("Report Type:", self.report_type_combo)
 
-        # Add report type explanation
-        report_type_explanation = QLabel(
+        # Add report type explanation, built on first request
+        self._add_explanation_row(
+            api_layout,
+            "report type explanation",
             """
 <b>Report Types:</b><br><br>
 • <b>Mediation Report:</b> Includes revenue from all sources (AdMob Network + Third-party mediation)<br>
 • <b>Network Report:</b> Only includes revenue from AdMob Network (direct ads)<br><br>
 <i>Use Mediation Report for complete revenue data including mediated ads.</i>
-        """
-        )
-        report_type_explanation.setWordWrap(True)
-        report_type_explanation.setStyleSheet(
-            "QLabel { font-size: 12px; color: #888; }"
+        """,
         )
-        # dynamically set the height of the label to the height of the text
-        api_layout.addRow("", report_type_explanation)
 
         # Test Connection Button
         self.test_connection_btn = QPushButton("Test Connection")
@@ -301,19 +865,19 @@ class SettingsTab(QWidget):
         forecast_group = QGroupBox("Forecast Settings")
         forecast_layout = QFormLayout()
 
-        self.forecast_days_spin = QSpinBox()
-        self.forecast_days_spin.setRange(1, 365 * 10)  # 10 years
-        self.forecast_days_spin.setValue(
-            self.config.get("forecast_settings.default_forecast_days", 30)
+        self.forecast_days_spin = _make_spin(
+            1,
+            365 * 10,  # 10 years
+            self.config.get("forecast_settings.default_forecast_days", 30),
+            " days",
         )
-        self.forecast_days_spin.setSuffix(" days")
 
-        self.backtest_days_spin = QSpinBox()
-        self.backtest_days_spin.setRange(1, 365 * 10)  # 10 years
-        self.backtest_days_spin.setValue(
-            self.config.get("forecast_settings.default_backtest_days", 90)
+        self.backtest_days_spin = _make_spin(
+            1,
+            365 * 10,  # 10 years
+            self.config.get("forecast_settings.default_backtest_days", 90),
+            " days",
         )
-        self.backtest_days_spin.setSuffix(" days")
 
         # SARIMA Parameters
         sarima_order = self.config.get("forecast_settings.sarima_order", [1, 1, 1])
@@ -321,33 +885,13 @@ class SettingsTab(QWidget):
             "forecast_settings.seasonal_order", [1, 1, 1, 7]
         )
 
-        self.p_spin = QSpinBox()
-        self.p_spin.setRange(0, 5)
-        self.p_spin.setValue(sarima_order[0])
-
-        self.d_spin = QSpinBox()
-        self.d_spin.setRange(0, 2)
-        self.d_spin.setValue(sarima_order[1])
-
-        self.q_spin = QSpinBox()
-        self.q_spin.setRange(0, 5)
-        self.q_spin.setValue(sarima_order[2])
-
-        self.sp_spin = QSpinBox()
-        self.sp_spin.setRange(0, 5)
-        self.sp_spin.setValue(seasonal_order[0])
-
-        self.sd_spin = QSpinBox()
-        self.sd_spin.setRange(0, 2)
-        self.sd_spin.setValue(seasonal_order[1])
-
-        self.sq_spin = QSpinBox()
-        self.sq_spin.setRange(0, 5)
-        self.sq_spin.setValue(seasonal_order[2])
-
-        self.seasonal_period_spin = QSpinBox()
-        self.seasonal_period_spin.setRange(2, 365)
-        self.seasonal_period_spin.setValue(seasonal_order[3])
+        self.p_spin = _make_spin(0, 5, sarima_order[0])
+        self.d_spin = _make_spin(0, 2, sarima_order[1])
+        self.q_spin = _make_spin(0, 5, sarima_order[2])
+        self.sp_spin = _make_spin(0, 5, seasonal_order[0])
+        self.sd_spin = _make_spin(0, 2, seasonal_order[1])
+        self.sq_spin = _make_spin(0, 5, seasonal_order[2])
+        self.seasonal_period_spin = _make_spin(2, 365, seasonal_order[3])
 
         forecast_layout.addRow("Default Forecast Days:", self.forecast_days_spin)
         forecast_layout.addRow("Default Backtest Days:", self.backtest_days_spin)
@@ -359,8 +903,10 @@ class SettingsTab(QWidget):
         forecast_layout.addRow("Seasonal Q:", self.sq_spin)
         forecast_layout.addRow("Seasonal Period:", self.seasonal_period_spin)
 
-        # Add SARIMA explanation
-        explanation_label = QLabel(
+        # Add SARIMA explanation, built on first request
+        self._add_explanation_row(
+            forecast_layout,
+            "parameter explanation",
             """
 <b>SARIMA Parameters Explanation:</b><br><br>
 
@@ -390,12 +936,8 @@ class SettingsTab(QWidget):
 <br><br>
 
 <i>Default values (1,1,1)(1,1,1,7) work well for daily revenue with weekly patterns.</i>
-        """
+        """,
         )
-        explanation_label.setWordWrap(True)
-        explanation_label.setStyleSheet("QLabel { font-size: 12px; color: #888; }")
-
-        forecast_layout.addRow("", explanation_label)
 
         forecast_group.setLayout(forecast_layout)
 
@@ -408,17 +950,17 @@ class SettingsTab(QWidget):
             self.config.get("ui_settings.auto_refresh", True)
         )
 
-        self.refresh_interval_spin = QSpinBox()
-        self.refresh_interval_spin.setRange(300, 86400)  # 5 minutes to 24 hours
-        self.refresh_interval_spin.setValue(
-            self.config.get("ui_settings.refresh_interval", 3600)
+        self.refresh_interval_spin = _make_spin(
+            300,
+            86400,  # 5 minutes to 24 hours
+            self.config.get("ui_settings.refresh_interval", 3600),
+            " seconds",
         )
-        self.refresh_interval_spin.setSuffix(" seconds")
 
         # Currency Settings
         self.currency_combo = QComboBox()
-        available_currencies = self.currency_formatter.get_available_currencies()
-        for currency_code, currency_name in available_currencies.items():
+        currency_choices = self.currency_formatter.get_currency_choices()
+        for currency_code, currency_name in currency_choices:
             self.currency_combo.addItem(currency_name, currency_code)
 
         # Set current currency
@@ -427,13 +969,12 @@ class SettingsTab(QWidget):
         if currency_index >= 0:
             self.currency_combo.setCurrentIndex(currency_index)
 
-        self.currency_combo.currentTextChanged.connect(self.on_currency_changed)
+        # activated only fires for user selections, not programmatic changes
+        self.currency_combo.activated.connect(self.on_currency_changed)
 
         # Exchange Rate Display
         self.exchange_rate_label = QLabel("Loading...")
-        self.exchange_rate_label.setStyleSheet(
-            "QLabel { color: #888; font-size: 12px; }"
-        )
+        self.exchange_rate_label.setStyleSheet(_STYLE_MUTED)
         self.update_exchange_rate_display()
 
         app_layout.addRow("Auto Refresh:", self.auto_refresh_check)
@@ -456,6 +997,31 @@ class SettingsTab(QWidget):
 
         self.setLayout(layout)
 
+    def _add_explanation_row(self, layout: QFormLayout, title: str, html: str):
+        """Add a button that builds and toggles an explanation label on demand"""
+
+        button = QPushButton(f"Show {title}")
+        label = None
+
+        def toggle():
+            nonlocal label
+            if label is None:
+                label = QLabel(html)
+                label.setTextFormat(Qt.TextFormat.RichText)
+                label.setWordWrap(True)
+                label.setStyleSheet(_STYLE_MUTED)
+
+                # Show the label right below its button
+                row, _ = layout.getWidgetPosition(button)
+                layout.insertRow(row + 1, "", label)
+            else:
+                label.setHidden(not label.isHidden())
+
+            button.setText(f"{'Show' if label.isHidden() else 'Hide'} {title}")
+
+        button.clicked.connect(toggle)
+        layout.addRow("", button)
+
     def upload_credentials_file(self):
         """Upload OAuth2 credentials JSON file to app directory"""
 
@@ -463,84 +1029,60 @@ class SettingsTab(QWidget):
             self, "Select OAuth2 Credentials File", "", "JSON Files (*.json)"
         )
         if file_path:
-            try:
-                import json
-                import shutil
-
-                # Validate JSON file first
-                with open(file_path, "r") as f:
-                    credentials = json.load(f)
-
-                # Check if it's a valid OAuth2 credentials file
-                valid_formats = ["installed", "web"]
-                is_valid = False
-
-                for format_type in valid_formats:
-                    if format_type in credentials:
-                        client_info = credentials[format_type]
-                        if (
-                            "client_id" in client_info
-                            and "client_secret" in client_info
-                        ):
-                            is_valid = True
-                            break
-
-                # Also check direct format
-                if (
-                    not is_valid
-                    and "client_id" in credentials
-                    and "client_secret" in credentials
-                ):
-                    is_valid = True
-
-                if not is_valid:
-                    QMessageBox.warning(
-                        self,
-                        "Invalid Credentials File",
-                        "The selected file does not appear to be a valid OAuth2 credentials JSON file.\n\n"
-                        "Please ensure you downloaded the correct file from Google Cloud Console.",
-                    )
-                    return
+            # Read, validate and copy the file off the GUI thread
+            self.upload_credentials_btn.setEnabled(False)
+            self.credentials_thread = CredentialsUploadThread(
+                file_path, self.config.credentials_file
+            )
+            self.credentials_thread.success.connect(self.on_credentials_uploaded)
+            self.credentials_thread.failure.connect(self.on_credentials_upload_failed)
+            self.credentials_thread.start()
 
-                # Copy file to app directory
-                target_path = self.config.credentials_file
-                shutil.copy2(file_path, target_path)
+    def on_credentials_uploaded(self):
+        """Handle a successfully uploaded credentials file"""
 
-                # Update status
-                self.update_credentials_status()
+        self.upload_credentials_btn.setEnabled(True)
 
-                # Update tab states in main window
-                self.update_main_window_tabs()
+        # The next fetch must authenticate with the new credentials
+        self.reset_api_client()
 
-                # Show success message
-                QMessageBox.information(
-                    self,
-                    "Credentials Uploaded",
-                    "OAuth2 credentials uploaded successfully!\n\n"
-                    "Please enter your Customer ID and test the connection.",
-                )
+        # Update status
+        self.update_credentials_status()
 
-            except Exception as e:
-                QMessageBox.warning(
-                    self,
-                    "Upload Error",
-                    f"Could not upload credentials file: {str(e)}\n\n"
-                    "Please ensure the file is a valid OAuth2 credentials JSON file.",
-                )
+        # Update tab states in main window
+        self.update_main_window_tabs()
+
+        # Show success message
+        QMessageBox.information(
+            self,
+            "Credentials Uploaded",
+            "OAuth2 credentials uploaded successfully!\n\n"
+            "Please enter your Customer ID and test the connection.",
+        )
+
+    def on_credentials_upload_failed(self, title: str, message: str):
+        """Handle a credentials file that could not be validated or copied"""
+
+        self.upload_credentials_btn.setEnabled(True)
+        QMessageBox.warning(self, title, message)
 
     def update_credentials_status(self):
         """Update the credentials status label"""
 
         if self.config.credentials_file.exists():
             self.credentials_status_label.setText("✓ Credentials file uploaded")
-            self.credentials_status_label.setStyleSheet(
-                "QLabel { color: #28a745; font-weight: bold; }"
-            )
+            self.credentials_status_label.setStyleSheet(_STYLE_CREDENTIALS_OK)
         else:
             self.credentials_status_label.setText("No credentials file uploaded")
-            self.credentials_status_label.setStyleSheet(
-                "QLabel { color: #888; font-style: italic; }"
-            )
+            self.credentials_status_label.setStyleSheet(_STYLE_CREDENTIALS_MISSING)
+
+    def reset_api_client(self, api_client: Optional[AdMobAPIClient] = None):
+        """Replace the data tab's reused API client, or drop it so the next
+        fetch authenticates afresh"""
+
+        main_window = self.window()
+        if hasattr(main_window, "data_tab"):
+            main_window.data_tab.api_client = api_client
 
     def update_main_window_tabs(self):
         """Update tab states in main window"""
@@ -559,8 +1101,8 @@ class SettingsTab(QWidget):
                 self.currency_formatter.set_local_currency(selected_currency)
                 # Update exchange rate display
                 self.update_exchange_rate_display()
-                # Auto-save settings when currency changes
-                self.save_settings()
+                # Auto-save once the selection settles
+                self._schedule_save("ui_settings.local_currency", selected_currency)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to change currency: {str(e)}")
 
@@ -572,34 +1114,55 @@ class SettingsTab(QWidget):
 
             if current_currency == "USD":
                 self.exchange_rate_label.setText("1.00 USD = 1.00 USD (Base currency)")
-                self.exchange_rate_label.setStyleSheet(
-                    "QLabel { color: #888; font-size: 12px; }"
-                )
-            else:
-                exchange_rate = self.currency_formatter.get_current_exchange_rate(
-                    current_currency
-                )
+                self.exchange_rate_label.setStyleSheet(_STYLE_MUTED)
+                return
 
-                if exchange_rate is not None:
-                    self.exchange_rate_label.setText(
-                        f"1.00 USD = {exchange_rate:,.2f} {current_currency}"
-                    )
-                    self.exchange_rate_label.setStyleSheet(
-                        "QLabel { color: #28a745; font-size: 12px; font-weight: bold; }"
-                    )
-                else:
-                    self.exchange_rate_label.setText("Exchange rate not available")
-                    self.exchange_rate_label.setStyleSheet(
-                        "QLabel { color: #dc3545; font-size: 12px; font-style: italic; }"
-                    )
+            cached = self._rate_cache.get(current_currency)
+            if (
+                cached is not None
+                and time.monotonic() - cached[1] < self.RATE_CACHE_TTL
+            ):
+                self.show_exchange_rate(current_currency, cached[0])
+                return
+
+            # Look the rate up off the GUI thread, it may need a network fetch
+            self.exchange_rate_label.setText("Loading...")
+            self.exchange_rate_label.setStyleSheet(_STYLE_MUTED)
+            if current_currency not in self._rate_threads:
+                thread = RateFetchThread(self.currency_formatter, current_currency)
+                thread.rate_ready.connect(self.on_rate_ready)
+                self._rate_threads[current_currency] = thread
+                thread.start()
 
         except Exception as e:
             self.exchange_rate_label.setText("Error loading exchange rate")
-            self.exchange_rate_label.setStyleSheet(
-                "QLabel { color: #dc3545; font-size: 12px; font-style: italic; }"
-            )
+            self.exchange_rate_label.setStyleSheet(_STYLE_RATE_MISSING)
             logging.error(f"Error updating exchange rate display: {str(e)}")
 
+    def on_rate_ready(self, currency: str, rate: Optional[float]):
+        """Cache a looked-up exchange rate and show it if still selected"""
+
+        thread = self._rate_threads.pop(currency, None)
+        if thread is not None:
+            thread.wait()
+
+        # Missing rates are not cached so the next selection retries
+        if rate is not None:
+            self._rate_cache[currency] = (rate, time.monotonic())
+
+        if currency == self.currency_formatter.get_local_currency():
+            self.show_exchange_rate(currency, rate)
+
+    def show_exchange_rate(self, currency: str, rate: Optional[float]):
+        """Show an exchange rate from USD in the exchange rate label"""
+
+        if rate is not None:
+            self.exchange_rate_label.setText(f"1.00 USD = {rate:,.2f} {currency}")
+            self.exchange_rate_label.setStyleSheet(_STYLE_RATE_OK)
+        else:
+            self.exchange_rate_label.setText("Exchange rate not available")
+            self.exchange_rate_label.setStyleSheet(_STYLE_RATE_MISSING)
+
     def test_connection(self):
         """Test AdMob API connection"""
 
@@ -611,10 +1174,15 @@ class SettingsTab(QWidget):
             api_client = AdMobAPIClient(self.config)
 
             if api_client.authenticate():
+                # Let the data tab reuse the authenticated client for its fetches
+                self.reset_api_client(api_client)
+
                 QMessageBox.information(
                     self, "Success", "Successfully connected to AdMob API!"
                 )
             else:
+                # Don't keep fetching with a client from an earlier test
+                self.reset_api_client()
                 QMessageBox.warning(
                     self,
                     "Error",
@@ -628,88 +1196,140 @@ class SettingsTab(QWidget):
         """Save all settings to configuration"""
 
         try:
-            # API Settings
-            self.config.set("api_settings.customer_id", self.customer_id_edit.text())
-            self.config.set(
-                "api_settings.report_type", self.report_type_combo.currentData()
-            )
+            self._do_save()
 
-            # Forecast Settings
-            self.config.set(
-                "forecast_settings.default_forecast_days",
-                self.forecast_days_spin.value(),
-            )
-            self.config.set(
-                "forecast_settings.default_backtest_days",
-                self.backtest_days_spin.value(),
-            )
-            self.config.set(
-                "forecast_settings.sarima_order",
-                [self.p_spin.value(), self.d_spin.value(), self.q_spin.value()],
-            )
-            self.config.set(
-                "forecast_settings.seasonal_order",
-                [
+            QMessageBox.information(self, "Success", "Settings saved successfully!")
+
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to save settings: {str(e)}")
+
+    def _schedule_save(self, key_path: str, value):
+        """Queue one setting for the next auto-save"""
+
+        self._pending_settings[key_path] = value
+        self._save_timer.start()
+
+    def _auto_save(self):
+        """Save the queued settings, without a confirmation dialog"""
+
+        self._save_timer.stop()
+        pending, self._pending_settings = self._pending_settings, {}
+        if not pending:
+            return
+
+        try:
+            self.config.update(pending)
+            self.update_main_window_tabs()
+        except Exception as e:
+            logging.error(f"Error auto-saving settings: {str(e)}")
+
+    def flush_pending_save(self):
+        """Write any auto-save still waiting on its timer"""
+
+        if self._save_timer.isActive():
+            self._auto_save()
+
+    def _do_save(self):
+        """Write the current widget values to the configuration"""
+
+        # A full save covers anything still queued for auto-save
+        self._save_timer.stop()
+        self._pending_settings = {}
+
+        # A client authenticated for another customer can't be reused
+        customer_id = self.customer_id_edit.text()
+        if customer_id != self.config.get("api_settings.customer_id", ""):
+            self.reset_api_client()
+
+        # Collect every setting and write only the ones that changed
+        self.config.update(
+            {
+                # API Settings
+                "api_settings.customer_id": customer_id,
+                "api_settings.report_type": self.report_type_combo.currentData(),
+                # Forecast Settings
+                "forecast_settings.default_forecast_days": self.forecast_days_spin.value(),
+                "forecast_settings.default_backtest_days": self.backtest_days_spin.value(),
+                "forecast_settings.sarima_order": [
+                    self.p_spin.value(),
+                    self.d_spin.value(),
+                    self.q_spin.value(),
+                ],
+                "forecast_settings.seasonal_order": [
                     self.sp_spin.value(),
                     self.sd_spin.value(),
                     self.sq_spin.value(),
                     self.seasonal_period_spin.value(),
                 ],
-            )
-
-            # Application Settings
-            self.config.set(
-                "ui_settings.auto_refresh", self.auto_refresh_check.isChecked()
-            )
-            self.config.set(
-                "ui_settings.refresh_interval", self.refresh_interval_spin.value()
-            )
-
-            # Update tab states in main window
-            self.update_main_window_tabs()
-
-            QMessageBox.information(self, "Success", "Settings saved successfully!")
+                # Application Settings
+                "ui_settings.local_currency": self.currency_formatter.get_local_currency(),
+                "ui_settings.auto_refresh": self.auto_refresh_check.isChecked(),
+                "ui_settings.refresh_interval": self.refresh_interval_spin.value(),
+            }
+        )
 
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save settings: {str(e)}")
+        # Update tab states in main window
+        self.update_main_window_tabs()
 
     def on_report_type_changed(self):
         """Handle report type change"""
 
         current_report_type = self.report_type_combo.currentData()
-        saved_report_type = self.config.get("api_settings.report_type", "mediation")
 
-        # Only update if actually changing from saved value
-        if current_report_type != saved_report_type:
-            # Save the new report type
-            self.config.set("api_settings.report_type", current_report_type)
-            self.update_main_window_tabs()
+        # Re-selecting the report type already in effect changes nothing
+        if current_report_type == self._last_committed_report_type:
+            return
+        self._last_committed_report_type = current_report_type
 
-            # Update status in main window if it exists
-            main_window = self.window()
-            if hasattr(main_window, "data_tab") and hasattr(
-                main_window.data_tab, "status_label"
-            ):
-                main_window.data_tab.status_label.setText(
-                    f"Changed to {current_report_type.title()} Report - fetch new data"
-                )
-                main_window.data_tab.status_label.setStyleSheet(
-                    "QLabel { color: #ff8c00; font-size: 12px; }"
-                )
+        # Save the new report type once the selection settles
+        self._schedule_save("api_settings.report_type", current_report_type)
+
+        # Update status in main window if it exists
+        main_window = self.window()
+        if hasattr(main_window, "data_tab") and hasattr(
+            main_window.data_tab, "status_label"
+        ):
+            main_window.data_tab.status_label.setText(
+                f"Changed to {current_report_type.title()} Report - fetch new data"
+            )
+            main_window.data_tab.status_label.setStyleSheet(_STYLE_WARNING)
 
 
 class DataTab(QWidget):
     """Data tab for fetching and viewing revenue data"""
 
+    # Emitted whenever current_data is replaced with newly loaded data
+    data_changed = pyqtSignal()
+
     def __init__(self, config, currency_formatter):
         super().__init__()
         self.config = config
         self.currency_formatter = currency_formatter
         self.data_processor = DataProcessor(config)
         self.current_data = pd.DataFrame()
+        # Bumped whenever current_data is replaced, for cheap change detection
+        self.data_version = 0
+        # Summary renders in flight, keyed by the data state they render
+        self._summary_threads = {}
+        self.export_thread = None
+        # Last rendered summary as ((data_version, currency, rates time), html)
+        self._summary_cache = None
+        self.fetch_signals = None
+        self.import_signals = None
+        self._fetching = False
+        # Kept between fetches so an authenticated session is reused
+        self.api_client: Optional[AdMobAPIClient] = None
         self.init_ui()
 
     def init_ui(self):
+        # Suspend updates while the form rows are added, then lay out once
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_ui()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _build_ui(self):
         layout = QVBoxLayout()
         layout.setSpacing(20)
 
@@ -720,23 +1340,15 @@ class DataTab(QWidget):
         # Date Range
         min_date, max_date = self.config.get_date_range()
 
-        self.start_date_edit = QDateEdit(
-            QDate.fromString(min_date.strftime("%Y-%m-%d"), "yyyy-MM-dd")
-        )
+        self.start_date_edit = QDateEdit(_to_qdate(min_date))
         self.start_date_edit.setCalendarPopup(True)
         # Remove minimum date restriction - allow any date
-        self.start_date_edit.setMaximumDate(
-            QDate.fromString(max_date.strftime("%Y-%m-%d"), "yyyy-MM-dd")
-        )
+        self.start_date_edit.setMaximumDate(_to_qdate(max_date))
 
-        self.end_date_edit = QDateEdit(
-            QDate.fromString(max_date.strftime("%Y-%m-%d"), "yyyy-MM-dd")
-        )
+        self.end_date_edit = QDateEdit(_to_qdate(max_date))
         self.end_date_edit.setCalendarPopup(True)
         # Remove minimum date restriction - allow any date
-        self.end_date_edit.setMaximumDate(
-            QDate.fromString(max_date.strftime("%Y-%m-%d"), "yyyy-MM-dd")
-        )
+        self.end_date_edit.setMaximumDate(_to_qdate(max_date))
 
         fetch_layout.addRow("Start Date:", self.start_date_edit)
         fetch_layout.addRow("End Date:", self.end_date_edit)
@@ -760,7 +1372,7 @@ class DataTab(QWidget):
 
         # Status Label
         self.status_label = QLabel("Ready")
-        self.status_label.setStyleSheet("QLabel { color: #888; font-size: 12px; }")
+        self.status_label.setStyleSheet(_STYLE_MUTED)
 
         fetch_layout.addRow("", buttons_layout)
         fetch_layout.addRow("Progress:", self.progress_bar)
@@ -787,6 +1399,7 @@ class DataTab(QWidget):
         summary_group = QGroupBox("Data Summary")
         self.summary_text = QTextEdit()
         self.summary_text.setReadOnly(True)
+        self.summary_text.setUndoRedoEnabled(False)
 
         summary_layout = QVBoxLayout()
         summary_layout.addWidget(self.summary_text)
@@ -802,6 +1415,10 @@ class DataTab(QWidget):
     def fetch_data(self):
         """Fetch data from AdMob API"""
 
+        # A fetch is already running on the worker pool
+        if self._fetching:
+            return
+
         try:
             if not self.config.is_api_configured():
                 QMessageBox.warning(
@@ -811,26 +1428,34 @@ class DataTab(QWidget):
                 )
                 return
 
-            start_date = self.start_date_edit.date().toString("yyyy-MM-dd")
-            end_date = self.end_date_edit.date().toString("yyyy-MM-dd")
+            start_date = self.start_date_edit.date().toPyDate()
+            end_date = self.end_date_edit.date().toPyDate()
 
             # Show current report type in status
             report_type = self.config.get("api_settings.report_type", "mediation")
             self.status_label.setText(f"Fetching {report_type} report data...")
 
-            # Create API client
-            api_client = AdMobAPIClient(self.config)
+            # Create API client on first fetch
+            if self.api_client is None:
+                self.api_client = AdMobAPIClient(self.config)
 
-            # Start fetching thread
-            self.fetch_thread = DataFetchingThread(api_client, start_date, end_date)
-            self.fetch_thread.progress_update.connect(self.update_progress)
-            self.fetch_thread.status_update.connect(self.update_status)
-            self.fetch_thread.data_ready.connect(self.on_data_ready)
-            self.fetch_thread.error_occurred.connect(self.on_fetch_error)
+            # Start fetching on the shared worker pool; the signals object is
+            # kept so it outlives the runnable, which the pool deletes when done
+            fetch_job = DataFetchingRunnable(
+                self.api_client, self.data_processor, start_date, end_date
+            )
+            self.fetch_signals = fetch_job.signals
+            self.fetch_signals.progress_update.connect(
+                self.update_progress, Qt.ConnectionType.QueuedConnection
+            )
+            self.fetch_signals.status_update.connect(self.update_status)
+            self.fetch_signals.data_ready.connect(self.on_fetch_finished)
+            self.fetch_signals.error_occurred.connect(self.on_fetch_error)
 
             self.progress_bar.setVisible(True)
             self.fetch_btn.setEnabled(False)
-            self.fetch_thread.start()
+            self._fetching = True
+            _worker_pool().start(fetch_job)
 
         except Exception as e:
             QMessageBox.critical(
@@ -844,15 +1469,11 @@ class DataTab(QWidget):
         try:
             min_date, max_date = self.config.get_date_range()
 
-            self.start_date_edit.setDate(
-                QDate.fromString(min_date.strftime("%Y-%m-%d"), "yyyy-MM-dd")
-            )
-            self.end_date_edit.setDate(
-                QDate.fromString(max_date.strftime("%Y-%m-%d"), "yyyy-MM-dd")
-            )
+            self.start_date_edit.setDate(_to_qdate(min_date))
+            self.end_date_edit.setDate(_to_qdate(max_date))
 
             self.status_label.setText("Ready")
-            self.status_label.setStyleSheet("QLabel { color: #888; font-size: 12px; }")
+            self.status_label.setStyleSheet(_STYLE_MUTED)
 
             QMessageBox.information(
                 self, "Success", "Date range reset to default values!"
@@ -861,9 +1482,7 @@ class DataTab(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to reset dates: {str(e)}")
             self.status_label.setText("Error resetting dates")
-            self.status_label.setStyleSheet(
-                "QLabel { color: #dc3545; font-size: 12px; }"
-            )
+            self.status_label.setStyleSheet(_STYLE_ERROR)
 
     def update_progress(self, value):
         """Update progress bar"""
@@ -875,9 +1494,18 @@ class DataTab(QWidget):
 
         self.status_label.setText(message)
 
+    def on_fetch_finished(self):
+        """Take the fetched data from the finished job and hand it on"""
+
+        data = self.fetch_signals.result
+        # Drop the job's reference so the frame is owned by the tab alone
+        self.fetch_signals.result = None
+        self.on_data_ready(data)
+
     def on_data_ready(self, data):
         """Handle data ready signal"""
 
+        self._fetching = False
         self.current_data = data
         self.progress_bar.setValue(0)
         self.fetch_btn.setEnabled(True)
@@ -887,7 +1515,7 @@ class DataTab(QWidget):
         self.status_label.setText(
             f"✓ {report_type.title()} report data loaded ({len(data)} days)"
         )
-        self.status_label.setStyleSheet("QLabel { color: #28a745; font-size: 12px; }")
+        self.status_label.setStyleSheet(_STYLE_OK)
 
         # Update data display
         self.update_data_display()
@@ -896,8 +1524,8 @@ class DataTab(QWidget):
         """Update data display after successful fetch"""
 
         try:
-            # Clean and validate data
-            self.current_data = self.data_processor.clean_data(self.current_data)
+            # The data arrives already cleaned by the fetch or import job
+            self.data_version += 1
 
             # Update summary
             self.update_data_summary()
@@ -905,130 +1533,71 @@ class DataTab(QWidget):
             # Enable export
             self.export_btn.setEnabled(True)
 
+            self.data_changed.emit()
+
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to process data: {str(e)}")
             self.status_label.setText("Error processing data")
-            self.status_label.setStyleSheet(
-                "QLabel { color: #dc3545; font-size: 12px; }"
-            )
+            self.status_label.setStyleSheet(_STYLE_ERROR)
 
     def on_fetch_error(self, error_message):
         """Handle fetch error signal"""
 
+        self._fetching = False
         self.progress_bar.setValue(0)
         self.fetch_btn.setEnabled(True)
         self.status_label.setText(f"Error: {error_message}")
-        self.status_label.setStyleSheet("QLabel { color: #dc3545; font-size: 12px; }")
+        self.status_label.setStyleSheet(_STYLE_ERROR)
         QMessageBox.critical(self, "Data Fetch Error", error_message)
 
     def update_data_summary(self):
         """Update data summary display"""
 
-        try:
-            if self.current_data.empty:
-                self.summary_text.setText("No data available")
-                return
+        if self.current_data.empty:
+            self.summary_text.setText("No data available")
+            return
 
-            summary = self.data_processor.get_data_summary(self.current_data)
+        key = self._summary_key()
+        if self._summary_cache is not None and self._summary_cache[0] == key:
+            self.summary_text.setHtml(self._summary_cache[1])
+            return
 
-            # Format currency values
-            revenue_stats = summary.get("revenue_stats", {})
-            total_revenue = self.currency_formatter.format_currency(
-                revenue_stats.get("total_revenue", 0)
-            )
-            avg_daily_revenue = self.currency_formatter.format_currency(
-                revenue_stats.get("average_daily_revenue", 0)
-            )
-            median_daily_revenue = self.currency_formatter.format_currency(
-                revenue_stats.get("median_daily_revenue", 0)
-            )
-            max_daily_revenue = self.currency_formatter.format_currency(
-                revenue_stats.get("max_daily_revenue", 0)
+        # Build the summary HTML off the GUI thread; earlier renders keep
+        # running and their results are dropped once they are out of date
+        if key not in self._summary_threads:
+            thread = SummaryRenderThread(
+                self.current_data, self.data_processor, self.currency_formatter
             )
-            min_daily_revenue = self.currency_formatter.format_currency(
-                revenue_stats.get("min_daily_revenue", 0)
+            thread.html_ready.connect(
+                lambda html, key=key: self.on_summary_ready(key, html)
             )
+            self._summary_threads[key] = thread
+            thread.start()
+
+    def _summary_key(self):
+        """The data state the summary depends on"""
+
+        # The summary only changes with the data, the display currency or a
+        # refresh of the exchange rates
+        return (
+            self.data_version,
+            self.currency_formatter.get_local_currency(),
+            self.currency_formatter.last_updated,
+        )
 
-            data_summary_text = create_table(
-                "Data Summary",
-                f"""
-<tr>
-{create_th("Date Range")}
-{create_td(summary.get('date_range', {}).get('start', 'N/A') + " to " + summary.get('date_range', {}).get('end', 'N/A'))}
-{create_td("Date range of the data")}
-</tr>
-
-<tr>
-{create_th("Total Days")}
-{create_td(str(summary.get('total_records', 0)))}
-{create_td("Total number of days in the data")}
-</tr>
-
-<tr>
-{create_th("Total Revenue")}
-{create_td(total_revenue)}
-{create_td("Total revenue from the data")}
-</tr>
-
-<tr>
-{create_th("Average Daily")}
-{create_td(avg_daily_revenue)}
-{create_td("Average daily revenue from the data")}
-</tr>
-
-<tr>
-{create_th("Highest Day")}
-{create_td(max_daily_revenue)}
-{create_td("Highest daily revenue from the data")}
-</tr>
-
-<tr>
-{create_th("Lowest Day")}
-{create_td(min_daily_revenue)}
-{create_td("Lowest daily revenue from the data")}
-</tr>
-
-<tr>
-{create_th("Zero Revenue Days")}
-{create_td(str(summary.get('revenue_stats', {}).get('zero_revenue_days', 0)))}
-{create_td("Number of days with zero revenue")}
-</tr>
-""",
-            )
+    def on_summary_ready(self, key, html):
+        """Show and remember the summary rendered for the given data state"""
 
-            data_quality_text = create_table(
-                "Data Quality",
-                f"""
-<tr>
-{create_th("Missing Values")}
-{create_td(str(summary.get('data_quality', {}).get('missing_values', 0)))}
-{create_td("Number of missing values in the data")}
-</tr>
-
-<tr>
-{create_th("Duplicates")}
-{create_td(str(summary.get('data_quality', {}).get('duplicate_dates', 0)))}
-{create_td("Number of duplicate rows in the data")}
-</tr>
-
-<tr>
-{create_th("Completeness")}
-{create_td(str(round(summary.get('data_quality', {}).get('completeness_pct', 0), 1)) + "%")}
-{create_td("Percentage of complete data")}
-</tr>
-""",
-            )
+        thread = self._summary_threads.pop(key, None)
+        if thread is not None:
+            thread.wait()
 
-            summary_text = f"""
-{data_summary_text}
-<br>
-{data_quality_text}
-"""
-            self.summary_text.setText(summary_text)
+        # Data or currency changed while this render ran
+        if key != self._summary_key():
+            return
 
-        except Exception as e:
-            self.summary_text.setText(f"Error updating summary: {str(e)}")
-            logging.error(f"Error updating data summary: {e}")
+        self._summary_cache = (key, html)
+        self.summary_text.setHtml(html)
 
     def export_data(self):
         """Export current data to file"""
@@ -1048,18 +1617,34 @@ class DataTab(QWidget):
             if file_path:
                 file_format = file_path.split(".")[-1].lower()
 
-                if self.data_processor.export_data(
-                    self.current_data, file_path, file_format
-                ):
-                    QMessageBox.information(
-                        self, "Success", "Data exported successfully!"
-                    )
-                else:
-                    QMessageBox.warning(self, "Error", "Failed to export data.")
+                # Write the file off the GUI thread, large exports take a while
+                self.export_btn.setEnabled(False)
+                self.status_label.setText("Exporting data...")
+                self.status_label.setStyleSheet(_STYLE_MUTED)
+
+                self.export_thread = ExportThread(
+                    self.current_data, self.data_processor, file_path, file_format
+                )
+                self.export_thread.export_done.connect(self.on_export_finished)
+                self.export_thread.start()
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Export failed: {str(e)}")
 
+    def on_export_finished(self, success):
+        """Handle the end of a background export"""
+
+        self.export_btn.setEnabled(True)
+
+        if success:
+            self.status_label.setText("✓ Data exported")
+            self.status_label.setStyleSheet(_STYLE_OK)
+            QMessageBox.information(self, "Success", "Data exported successfully!")
+        else:
+            self.status_label.setText("Error: Failed to export data")
+            self.status_label.setStyleSheet(_STYLE_ERROR)
+            QMessageBox.warning(self, "Error", "Failed to export data.")
+
     def import_data(self):
         """Import data from file"""
 
@@ -1074,19 +1659,36 @@ class DataTab(QWidget):
             if file_path:
                 file_format = file_path.split(".")[-1].lower()
 
-                imported_data = self.data_processor.import_data(file_path, file_format)
+                # Read and clean the file on the worker pool
+                self.status_label.setText("Importing data...")
+                self.status_label.setStyleSheet(_STYLE_MUTED)
 
-                if not imported_data.empty:
-                    self.on_data_ready(imported_data)
-                    QMessageBox.information(
-                        self, "Success", "Data imported successfully!"
-                    )
-                else:
-                    QMessageBox.warning(self, "Error", "Failed to import data.")
+                import_job = DataImportRunnable(
+                    self.data_processor, file_path, file_format
+                )
+                self.import_signals = import_job.signals
+                self.import_signals.data_ready.connect(self.on_import_finished)
+                self.import_signals.error_occurred.connect(self.on_import_error)
+                _worker_pool().start(import_job)
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Import failed: {str(e)}")
 
+    def on_import_finished(self):
+        """Take the imported data from the finished job and hand it on"""
+
+        data = self.import_signals.result
+        self.import_signals.result = None
+        self.on_data_ready(data)
+        QMessageBox.information(self, "Success", "Data imported successfully!")
+
+    def on_import_error(self, error_message):
+        """Handle a failed import"""
+
+        self.status_label.setText(f"Error: {error_message}")
+        self.status_label.setStyleSheet(_STYLE_ERROR)
+        QMessageBox.warning(self, "Error", error_message)
+
     def get_current_data(self):
         """Get current data for use in other tabs"""
 
@@ -1096,12 +1698,23 @@ class DataTab(QWidget):
 class ForecastTab(QWidget):
     """Forecast tab for running forecasts and viewing results"""
 
+    # Emitted whenever forecast_results is replaced with new results
+    forecast_changed = pyqtSignal()
+
     def __init__(self, config, data_tab, currency_formatter):
         super().__init__()
         self.config = config
         self.data_tab = data_tab
         self.currency_formatter = currency_formatter
         self.forecast_results = {}
+        # Bumped whenever forecast_results is replaced
+        self.forecast_version = 0
+        # Last rendered results as ((forecast_version, currency, rates time), html)
+        self._results_cache = None
+        self.forecast_signals = None
+        self._forecasting = False
+        # Set when a forecast is requested while another one is running
+        self._rerun_pending = False
         self.init_ui()
 
     def init_ui(self):
@@ -1112,23 +1725,23 @@ class ForecastTab(QWidget):
         forecast_group = QGroupBox("Forecast Controls")
         forecast_layout = QFormLayout()
 
-        self.forecast_days_spin = QSpinBox()
-        self.forecast_days_spin.setRange(1, 365 * 10)  # 10 years
-        self.forecast_days_spin.setValue(
-            self.config.get("forecast_settings.default_forecast_days", 30)
+        self.forecast_days_spin = _make_spin(
+            1,
+            365 * 10,  # 10 years
+            self.config.get("forecast_settings.default_forecast_days", 30),
+            " days",
         )
-        self.forecast_days_spin.setSuffix(" days")
 
         self.run_backtest_check = QCheckBox()
         self.run_backtest_check.setChecked(True)
 
         # Backtest duration
-        self.backtest_days_spin = QSpinBox()
-        self.backtest_days_spin.setRange(1, 365 * 10)  # 10 years
-        self.backtest_days_spin.setValue(
-            self.config.get("forecast_settings.default_backtest_days", 90)
+        self.backtest_days_spin = _make_spin(
+            1,
+            365 * 10,  # 10 years
+            self.config.get("forecast_settings.default_backtest_days", 90),
+            " days",
         )
-        self.backtest_days_spin.setSuffix(" days")
 
         forecast_layout.addRow("Forecast Days:", self.forecast_days_spin)
         forecast_layout.addRow("Run Backtest:", self.run_backtest_check)
@@ -1143,7 +1756,7 @@ class ForecastTab(QWidget):
 
         # Status Label
         self.status_label = QLabel("Ready")
-        self.status_label.setStyleSheet("QLabel { color: #888; font-size: 12px; }")
+        self.status_label.setStyleSheet(_STYLE_MUTED)
 
         forecast_layout.addRow("", self.run_forecast_btn)
         forecast_layout.addRow("Progress:", self.progress_bar)
@@ -1155,6 +1768,7 @@ class ForecastTab(QWidget):
         results_group = QGroupBox("Forecast Results")
         self.results_text = QTextEdit()
         self.results_text.setReadOnly(True)
+        self.results_text.setUndoRedoEnabled(False)
 
         results_layout = QVBoxLayout()
         results_layout.addWidget(self.results_text)
@@ -1169,6 +1783,12 @@ class ForecastTab(QWidget):
     def run_forecast(self):
         """Run forecasting model"""
 
+        # A forecast is already running on the worker pool; run again with the
+        # latest data and settings once it is done
+        if self._forecasting:
+            self._rerun_pending = True
+            return
+
         try:
             # Get current data
             current_data = self.data_tab.get_current_data()
@@ -1182,7 +1802,7 @@ class ForecastTab(QWidget):
 
             # Show initial status
             self.status_label.setText("Preparing forecast...")
-            self.status_label.setStyleSheet("QLabel { color: #888; font-size: 12px; }")
+            self.status_label.setStyleSheet(_STYLE_MUTED)
 
             # Validate backtest duration
             if run_backtest:
@@ -1201,32 +1821,32 @@ class ForecastTab(QWidget):
                     self.status_label.setText(
                         "Error: Insufficient data for backtesting"
                     )
-                    self.status_label.setStyleSheet(
-                        "QLabel { color: #dc3545; font-size: 12px; }"
-                    )
+                    self.status_label.setStyleSheet(_STYLE_ERROR)
                     return
 
-            # Start forecasting thread
-            self.forecast_thread = ForecastingThread(
+            # Start forecasting on the shared worker pool
+            forecast_job = ForecastingRunnable(
                 current_data, self.config, forecast_days, run_backtest, backtest_days
             )
-            self.forecast_thread.progress_update.connect(self.update_progress)
-            self.forecast_thread.status_update.connect(self.update_status)
-            self.forecast_thread.forecast_ready.connect(self.on_forecast_ready)
-            self.forecast_thread.error_occurred.connect(self.on_forecast_error)
+            self.forecast_signals = forecast_job.signals
+            self.forecast_signals.progress_update.connect(
+                self.update_progress, Qt.ConnectionType.QueuedConnection
+            )
+            self.forecast_signals.status_update.connect(self.update_status)
+            self.forecast_signals.forecast_ready.connect(self.on_forecast_ready)
+            self.forecast_signals.error_occurred.connect(self.on_forecast_error)
 
             self.progress_bar.setVisible(True)
             self.run_forecast_btn.setEnabled(False)
-            self.forecast_thread.start()
+            self._forecasting = True
+            _worker_pool().start(forecast_job)
 
         except Exception as e:
             QMessageBox.critical(
                 self, "Error", f"Failed to start forecasting: {str(e)}"
             )
             self.status_label.setText("Error starting forecast")
-            self.status_label.setStyleSheet(
-                "QLabel { color: #dc3545; font-size: 12px; }"
-            )
+            self.status_label.setStyleSheet(_STYLE_ERROR)
 
     def update_progress(self, value):
         """Update progress bar"""
@@ -1241,18 +1861,20 @@ class ForecastTab(QWidget):
     def on_forecast_ready(self, forecast_data, results):
         """Handle successful forecasting"""
 
+        self._forecasting = False
+
         try:
             self.forecast_results = results
+            self.forecast_version += 1
 
             # Update results display
             self.update_results_display()
+            self.forecast_changed.emit()
 
             # Update status with success
             forecast_days = len(forecast_data)
             self.status_label.setText(f"✓ Forecast completed ({forecast_days} days)")
-            self.status_label.setStyleSheet(
-                "QLabel { color: #28a745; font-size: 12px; }"
-            )
+            self.status_label.setStyleSheet(_STYLE_OK)
 
             # Reset progress bar
             self.progress_bar.setValue(0)
@@ -1263,18 +1885,28 @@ class ForecastTab(QWidget):
                 self, "Error", f"Failed to process forecast results: {str(e)}"
             )
             self.status_label.setText("Error processing forecast results")
-            self.status_label.setStyleSheet(
-                "QLabel { color: #dc3545; font-size: 12px; }"
-            )
+            self.status_label.setStyleSheet(_STYLE_ERROR)
+
+        self._start_pending_rerun()
 
     def on_forecast_error(self, error_message):
         """Handle forecasting errors"""
 
         QMessageBox.critical(self, "Forecast Error", error_message)
         self.status_label.setText(f"Error: {error_message}")
-        self.status_label.setStyleSheet("QLabel { color: #dc3545; font-size: 12px; }")
+        self.status_label.setStyleSheet(_STYLE_ERROR)
         self.progress_bar.setValue(0)
         self.run_forecast_btn.setEnabled(True)
+        self._forecasting = False
+
+        self._start_pending_rerun()
+
+    def _start_pending_rerun(self):
+        """Run the forecast requested while the previous one was running"""
+
+        if self._rerun_pending:
+            self._rerun_pending = False
+            self.run_forecast()
 
     def update_results_display(self):
         """Update forecast results display"""
@@ -1284,58 +1916,62 @@ class ForecastTab(QWidget):
                 self.results_text.setText("No forecast results available.")
                 return
 
-            diagnostics = self.forecast_results.get("diagnostics", {})
-            forecast_data = self.forecast_results.get("forecast_data", pd.DataFrame())
+            # Results only change with a new forecast, the display currency or
+            # a refresh of the exchange rates
+            key = (
+                self.forecast_version,
+                self.currency_formatter.get_local_currency(),
+                self.currency_formatter.last_updated,
+            )
+            if self._results_cache is not None and self._results_cache[0] == key:
+                self.results_text.setText(self._results_cache[1])
+                return
 
-            def format_numeric(value, default="N/A"):
-                """Safely format numeric values"""
+            diagnostics = self.forecast_results.get("diagnostics") or {}
+            forecast_data = self.forecast_results.get("forecast_data", pd.DataFrame())
 
-                if value is None or value == "N/A":
-                    return default
-                try:
-                    return f"{float(value):.2f}"
-                except (ValueError, TypeError):
-                    return default
+            # Format the model statistics once, up front
+            formatted = {
+                key: format_numeric(diagnostics.get(key))
+                for key in ("aic", "bic", "log_likelihood")
+            }
 
             forecast_results = create_table(
                 "Forecast Results",
-                f"""
-<tr>
-{create_th("Forecast Period")}
-{create_td(str(len(forecast_data)) + " days")}
-{create_td("Days to forecast")}
-</tr>
-
-<tr>
-{create_th("Model AIC")}
-{create_td(format_numeric(diagnostics.get('aic')))}
-{create_td("Akaike Information Criterion: Lower values indicate better model fit")}
-</tr>
-
-<tr>
-{create_th("Model BIC")}
-{create_td(format_numeric(diagnostics.get('bic')))}
-{create_td("Bayesian Information Criterion: Lower values indicate better model fit")}
-</tr>
-
-<tr>
-{create_th("Log Likelihood")}
-{create_td(format_numeric(diagnostics.get('log_likelihood')))}
-{create_td("Higher values indicate better model fit")}
-</tr>
-
-<tr>
-{create_th("Model Order")}
-{create_td(diagnostics.get('model_order', 'N/A'))}
-{create_td("p, d, q: AutoRegressive, Differencing, Moving Average terms")}
-</tr>
-
-<tr>
-{create_th("Seasonal Order")}
-{create_td(diagnostics.get('seasonal_order', 'N/A'))}
-{create_td("P, D, Q, s: Seasonal AR, Differencing, MA terms, seasonal period")}
-</tr>
-""",
+                create_rows(
+                    [
+                        (
+                            "Forecast Period",
+                            str(len(forecast_data)) + " days",
+                            "Days to forecast",
+                        ),
+                        (
+                            "Model AIC",
+                            formatted["aic"],
+                            "Akaike Information Criterion: Lower values indicate better model fit",
+                        ),
+                        (
+                            "Model BIC",
+                            formatted["bic"],
+                            "Bayesian Information Criterion: Lower values indicate better model fit",
+                        ),
+                        (
+                            "Log Likelihood",
+                            formatted["log_likelihood"],
+                            "Higher values indicate better model fit",
+                        ),
+                        (
+                            "Model Order",
+                            diagnostics.get("model_order", "N/A"),
+                            "p, d, q: AutoRegressive, Differencing, Moving Average terms",
+                        ),
+                        (
+                            "Seasonal Order",
+                            diagnostics.get("seasonal_order", "N/A"),
+                            "P, D, Q, s: Seasonal AR, Differencing, MA terms, seasonal period",
+                        ),
+                    ]
+                ),
             )
 
             # Format the results similar to data summary
@@ -1345,35 +1981,38 @@ class ForecastTab(QWidget):
 
             if "backtest" in self.forecast_results:
                 backtest = self.forecast_results["backtest"]
-                metrics = backtest.get("metrics", {})
+                metrics = backtest.get("metrics") or {}
+                formatted_metrics = {
+                    key: format_numeric(metrics.get(key))
+                    for key in ("rmse", "mae", "mape")
+                }
 
                 backtest_results = create_table(
                     "Backtest Results",
-                    f"""
-<tr>
-{create_th("Test Period")}
-{create_td(backtest.get('test_period', 'N/A'))}
-{create_td("Days used for backtesting")}
-</tr>
-
-<tr>
-{create_th("RMSE")}
-{create_td(format_numeric(metrics.get('rmse')))}
-{create_td("Root Mean Square Error: Lower values indicate better accuracy")}
-</tr>
-
-<tr>
-{create_th("MAE")}
-{create_td(format_numeric(metrics.get('mae')))}
-{create_td("Mean Absolute Error: Lower values indicate better accuracy")}
-</tr>
-
-<tr>
-{create_th("MAPE")}
-{create_td(format_numeric(metrics.get('mape')) + "%")}
-{create_td("Mean Absolute Percentage Error: Lower percentages indicate better accuracy")}
-</tr>
-""",
+                    create_rows(
+                        [
+                            (
+                                "Test Period",
+                                backtest.get("test_period", "N/A"),
+                                "Days used for backtesting",
+                            ),
+                            (
+                                "RMSE",
+                                formatted_metrics["rmse"],
+                                "Root Mean Square Error: Lower values indicate better accuracy",
+                            ),
+                            (
+                                "MAE",
+                                formatted_metrics["mae"],
+                                "Mean Absolute Error: Lower values indicate better accuracy",
+                            ),
+                            (
+                                "MAPE",
+                                formatted_metrics["mape"] + "%",
+                                "Mean Absolute Percentage Error: Lower percentages indicate better accuracy",
+                            ),
+                        ]
+                    ),
                 )
 
                 results_text += f"""
@@ -1381,6 +2020,7 @@ class ForecastTab(QWidget):
 {backtest_results}
 """
 
+            self._results_cache = (key, results_text)
             self.results_text.setText(results_text)
 
         except Exception as e:
@@ -1413,19 +2053,22 @@ class VisualizationTab(QWidget):
         if WEB_ENGINE_AVAILABLE:
             self.web_view = QWebEngineView()
             self.web_view.setContentsMargins(0, 0, 0, 0)
+
+            # The chart page is loaded on the first draw
+            self._chart_page_url = None
+            self._chart_page_loading = False
+            self._chart_page_ready = False
+            # Figure waiting for the chart page to finish loading
+            self._pending_figure_js = None
+            # The empty chart never changes, so its script is built once
+            self._empty_chart_js = None
+            self.web_view.loadFinished.connect(self.on_chart_page_loaded)
         else:
             self.web_view = QTextEdit()
             self.web_view.setReadOnly(True)
+            self.web_view.setUndoRedoEnabled(False)
             self.web_view.setContentsMargins(0, 0, 0, 0)
-            self.web_view.setHtml(
-                """
-                <h2>Web Engine Not Available</h2>
-                <p>PyQt6-WebEngine is not installed. Interactive charts are not available.</p>
-                <p>To enable interactive charts, install PyQt6-WebEngine:</p>
-                <pre>pip install PyQt6-WebEngine</pre>
-                <p>Chart data will be displayed as text when available.</p>
-            """
-            )
+            self.web_view.setHtml(_NO_WEB_ENGINE_HTML)
 
         # Layout
         layout.addWidget(self.web_view)
@@ -1439,210 +2082,261 @@ class VisualizationTab(QWidget):
         # Initial empty chart
         self.show_empty_chart()
 
-        # Auto-update chart when forecast data is available
-        self.auto_update_timer = QTimer()
-        self.auto_update_timer.timeout.connect(self.check_and_update_chart)
-        self.auto_update_timer.start(1000)  # Check every second
+        # Data/forecast versions, currency and options the chart was last
+        # drawn for
+        self._drawn_state = None
 
-        # Track last update state
-        self.last_data_hash = None
-        self.last_forecast_hash = None
+        # Converted actual revenue series keyed by (data version, currency)
+        self._conv_cache = {}
 
-    def check_and_update_chart(self):
-        """Check if data/forecast has changed and update chart if needed"""
+        # Set when an update came in while the tab was hidden
+        self._chart_dirty = False
 
-        try:
-            current_data = self.data_tab.get_current_data()
-            forecast_results = self.forecast_tab.get_forecast_results()
+        # Coalesce bursts of changes (e.g. data and forecast arriving
+        # together) into a single redraw
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(150)
+        self._redraw_timer.timeout.connect(self.update_chart)
+
+        # Redraw the chart whenever the data or the forecast changes
+        self.data_tab.data_changed.connect(self._redraw_timer.start)
+        self.forecast_tab.forecast_changed.connect(self._redraw_timer.start)
+
+    def show_empty_chart(self):
+        """Show empty chart when no data is available"""
+
+        if WEB_ENGINE_AVAILABLE:
+            if self._empty_chart_js is not None:
+                self.render_figure_js(self._empty_chart_js)
+                return
 
-            # Create hashes to detect changes
-            data_hash = hash(
-                str(current_data.values.tobytes() if not current_data.empty else "")
+            import plotly.graph_objects as go
+
+            fig = go.Figure(
+                layout=dict(
+                    _CHART_LAYOUT,
+                    annotations=[
+                        dict(
+                            text="No data available. Please fetch data and run forecast.",
+                            x=0.5,
+                            y=0.5,
+                            xref="paper",
+                            yref="paper",
+                            showarrow=False,
+                            font=dict(size=16),
+                        )
+                    ],
+                )
             )
-            forecast_hash = hash(str(forecast_results))
 
-            # Check if data or forecast has changed
-            if (
-                data_hash != self.last_data_hash
-                or forecast_hash != self.last_forecast_hash
-            ):
+            self._empty_chart_js = _figure_js(fig)
+            self.render_figure_js(self._empty_chart_js)
+        else:
+            self.web_view.setHtml(_EMPTY_FALLBACK_HTML)
 
-                self.last_data_hash = data_hash
-                self.last_forecast_hash = forecast_hash
+    def load_chart_page(self):
+        """Load the chart page, writing it and plotly.js to the cache if missing"""
 
-                # Update chart
-                self.update_chart()
+        import plotly
 
-        except Exception as e:
-            # Silently ignore errors in auto-update
-            pass
+        # Kept per plotly version, so plotly.js is only written out once
+        chart_dir = self.config.cache_dir / f"chart-{plotly.__version__}"
+        page_path = chart_dir / "chart.html"
 
-    def show_empty_chart(self):
-        """Show empty chart when no data is available"""
+        if not page_path.exists():
+            from plotly.offline import get_plotlyjs
 
-        if WEB_ENGINE_AVAILABLE:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="No data available. Please fetch data and run forecast.",
-                x=0.5,
-                y=0.5,
-                xref="paper",
-                yref="paper",
-                showarrow=False,
-                font=dict(size=16),
-            )
-            fig.update_layout(
-                title="AdMob Revenue Forecast",
-                xaxis_title="Date",
-                yaxis_title="Revenue (USD)",
-                template="plotly_dark",
-                paper_bgcolor="black",  # Black background
-                plot_bgcolor="black",  # Black plot area
+            chart_dir.mkdir(parents=True, exist_ok=True)
+            (chart_dir / "plotly.min.js").write_text(get_plotlyjs(), encoding="utf-8")
+            # The page goes last, marking the directory complete
+            page_path.write_text(_CHART_PAGE_HTML, encoding="utf-8")
+
+        self._chart_page_url = QUrl.fromLocalFile(str(page_path))
+
+        self._chart_page_loading = True
+        self.web_view.load(self._chart_page_url)
+
+    def on_chart_page_loaded(self, ok):
+        """Draw the figure that was waiting for the chart page"""
+
+        self._chart_page_loading = False
+        # Other pages (e.g. the error fallback) don't have plotly loaded
+        self._chart_page_ready = ok and self.web_view.url() == self._chart_page_url
+        if self._chart_page_ready and self._pending_figure_js is not None:
+            self.web_view.page().runJavaScript(self._pending_figure_js)
+            self._pending_figure_js = None
+
+    def render_figure(self, fig):
+        """Draw a figure in place on the chart page with Plotly.react"""
+
+        self.render_figure_js(_figure_js(fig))
+
+    def render_figure_js(self, figure_js):
+        """Run a Plotly.react script on the chart page, loading it if needed"""
+
+        if self._chart_page_ready:
+            self.web_view.page().runJavaScript(figure_js)
+            return
+
+        # Only the latest figure matters once the page is up
+        self._pending_figure_js = figure_js
+        if not self._chart_page_loading:
+            self.load_chart_page()
+
+    def _get_converted_series(self, current_data, local_currency):
+        """Return cumulative and local-currency series for the actual data"""
+
+        key = (self.data_tab.data_version, local_currency)
+        cached = self._conv_cache.get(key)
+        if cached is not None:
+            return cached
+
+        exchange_rate = None
+        if local_currency != "USD":
+            exchange_rate = self.currency_formatter.get_current_exchange_rate(
+                local_currency
             )
 
-            html = fig.to_html(include_plotlyjs=True)
-
-            # Add custom CSS to remove all margins and padding
-            css = """
-            <style>
-            html, body {
-                margin: 0 !important;
-                padding: 0 !important;
-                width: 100% !important;
-                height: 100% !important;
-                background: transparent !important;
-            }
-            </style>
-            """
+        cumulative = None
+        if "revenue_cumulative" in current_data.columns:
+            cumulative = current_data["revenue_cumulative"].to_numpy(dtype=float)
 
-            # Insert CSS into the HTML head
-            html = html.replace("<head>", f"<head>{css}")
+        cumulative, converted = _convert_and_cum(
+            current_data["revenue"].to_numpy(dtype=float),
+            exchange_rate,
+            cumulative=cumulative,
+        )
+        # Keep the dates on the cumulative series for the backtest lookups
+        customdata = pd.Series(cumulative, index=current_data.index)
 
-            self.web_view.setHtml(html)
-        else:
-            self.web_view.setHtml(
-                """
-                <h2>AdMob Revenue Forecast</h2>
-                <p><strong>Status:</strong> No data available</p>
-                <p>Please fetch data and run forecast to see results.</p>
-                <p><em>Note: Interactive charts require PyQt6-WebEngine installation.</em></p>
-            """
+        result = (customdata, converted, exchange_rate)
+
+        # Don't pin a failed rate lookup; retry it on the next redraw
+        if local_currency != "USD" and exchange_rate is None:
+            return result
+
+        # Entries for older data are stale, so only keep the current version
+        if any(k[0] != key[0] for k in self._conv_cache):
+            self._conv_cache.clear()
+        self._conv_cache[key] = result
+
+        return result
+
+    def _build_trace_spec(
+        self,
+        series,
+        cumulative,
+        name,
+        label,
+        line,
+        local_currency,
+        exchange_rate,
+        converted,
+    ):
+        """Build go.Scatter keyword arguments for a revenue line"""
+
+        # Long lines are thinned out, along with their hover data
+        positions = _lttb_indices(series.to_numpy(dtype=np.float64), _MAX_TRACE_POINTS)
+        if positions is not None:
+            series = series.iloc[positions]
+            cumulative = np.asarray(cumulative)[positions]
+            if converted is not None:
+                converted = tuple(np.asarray(values)[positions] for values in converted)
+
+        spec = dict(x=series.index, y=series, mode="lines", name=name, line=line)
+
+        if exchange_rate is None:
+            # USD, or no exchange rate available: show only USD
+            # A plain array serializes as a float buffer, unlike a Series
+            spec["customdata"] = np.asarray(cumulative)
+            spec["hovertemplate"] = _hover_template(label, None)
+            return spec
+
+        daily_local, cumulative_local = converted
+
+        # Custom data columns: [daily_local, cumulative_usd, cumulative_local]
+        spec["customdata"] = np.column_stack(
+            (
+                np.asarray(daily_local),
+                np.asarray(cumulative),
+                np.asarray(cumulative_local),
             )
+        )
+        spec["hovertemplate"] = _hover_template(label, local_currency)
+        return spec
+
+    def showEvent(self, event):
+        """Draw a chart update that was put off while the tab was hidden"""
+
+        super().showEvent(event)
+        if self._chart_dirty:
+            self.update_chart()
 
     def update_chart(self):
         """Update the chart with current data and forecasts"""
 
+        # Nobody sees the chart while another tab is open, draw it when shown
+        if not self.isVisible():
+            self._chart_dirty = True
+            return
+        self._chart_dirty = False
+
         try:
+            local_currency = self.currency_formatter.get_local_currency()
+
+            # Nothing to redraw if neither the inputs, the currency nor the
+            # chart options changed
+            state = (
+                self.data_tab.data_version,
+                self.forecast_tab.forecast_version,
+                local_currency,
+                self.show_confidence_intervals,
+                self.show_backtest,
+            )
+            if state == self._drawn_state:
+                return
+
+            import plotly.graph_objects as go
+
             # Get current data
             current_data = self.data_tab.get_current_data()
 
             if current_data.empty:
                 self.show_empty_chart()
+                self._drawn_state = state
                 return
 
             # Get forecast results
             forecast_results = self.forecast_tab.get_forecast_results()
 
-            # Create figure
-            fig = go.Figure()
+            # Traces are collected as plain dicts and validated once when the
+            # figure is built. Forecast, backtest and confidence band lines are
+            # drawn with WebGL, which stays fast on long horizons
+            traces = []
 
-            # Add actual revenue data
-            customdata = (
-                current_data["revenue_cumulative"]
-                if "revenue_cumulative" in current_data.columns
-                else current_data["revenue"].cumsum()
+            # Cumulative and converted series only change with the data or
+            # the currency, so reuse them across redraws
+            customdata, converted, exchange_rate = self._get_converted_series(
+                current_data, local_currency
             )
 
-            # Format hover template with currency formatter
-            local_currency = self.currency_formatter.get_local_currency()
-
-            if local_currency == "USD":
-                hover_template = (
-                    "<b>%{x}</b><br>"
-                    + "Daily Revenue: %{y:,.2f} USD<br>"
-                    + "Cumulative Revenue: %{customdata:,.2f} USD<br>"
-                    + "<extra></extra>"
-                )
-
-                # For USD, we can use the original data
-                customdata_converted = customdata
-                daily_converted = current_data["revenue"]
-            else:
-                exchange_rate = self.currency_formatter.get_current_exchange_rate(
-                    local_currency
-                )
-                if exchange_rate is not None:
-                    # Pre-calculate converted values
-                    daily_converted = current_data["revenue"] * exchange_rate
-                    customdata_converted = customdata * exchange_rate
-
-                    hover_template = (
-                        "<b>%{x}</b><br>"
-                        + f"Daily Revenue: %{{y:,.2f}} USD (%{{customdata:,.2f}} {local_currency})<br>"
-                        + f"Cumulative Revenue: %{{customdata2:,.2f}} USD (%{{customdata3:,.2f}} {local_currency})<br>"
-                        + "<extra></extra>"
-                    )
-                else:
-                    # If no exchange rate available, show only USD
-                    hover_template = (
-                        "<b>%{x}</b><br>"
-                        + "Daily Revenue: %{y:,.2f} USD<br>"
-                        + "Cumulative Revenue: %{customdata:,.2f} USD<br>"
-                        + "<extra></extra>"
-                    )
-
-                    customdata_converted = customdata
-                    daily_converted = current_data["revenue"]
-
-            # Prepare custom data arrays for hover template
-            if local_currency == "USD":
-                fig.add_trace(
-                    go.Scatter(
-                        x=current_data.index,
-                        y=current_data["revenue"],
-                        mode="lines",
-                        name="Actual Revenue",
-                        line=dict(color="#1f77b4", width=2),
-                        customdata=customdata,
-                        hovertemplate=hover_template,
-                    )
-                )
-            else:
-                exchange_rate = self.currency_formatter.get_current_exchange_rate(
-                    local_currency
+            # Add actual revenue data
+            traces.append(
+                dict(
+                    type="scatter",
+                    **self._build_trace_spec(
+                        current_data["revenue"],
+                        customdata,
+                        "Actual Revenue",
+                        "Daily Revenue",
+                        dict(color="#1f77b4", width=2),
+                        local_currency,
+                        exchange_rate,
+                        converted,
+                    ),
                 )
-                if exchange_rate is not None:
-                    # Create array of custom data: [daily_local, cumulative_usd, cumulative_local]
-                    custom_data_array = list(
-                        zip(daily_converted, customdata, customdata_converted)
-                    )
-
-                    fig.add_trace(
-                        go.Scatter(
-                            x=current_data.index,
-                            y=current_data["revenue"],
-                            mode="lines",
-                            name="Actual Revenue",
-                            line=dict(color="#1f77b4", width=2),
-                            customdata=custom_data_array,
-                            hovertemplate="<b>%{x}</b><br>"
-                            + f"Daily Revenue: %{{y:,.2f}} USD (%{{customdata[0]:,.2f}} {local_currency})<br>"
-                            + f"Cumulative Revenue: %{{customdata[1]:,.2f}} USD (%{{customdata[2]:,.2f}} {local_currency})<br>"
-                            + "<extra></extra>",
-                        )
-                    )
-                else:
-                    fig.add_trace(
-                        go.Scatter(
-                            x=current_data.index,
-                            y=current_data["revenue"],
-                            mode="lines",
-                            name="Actual Revenue",
-                            line=dict(color="#1f77b4", width=2),
-                            customdata=customdata,
-                            hovertemplate=hover_template,
-                        )
-                    )
+            )
 
             # Add forecast data if available
             if forecast_results and "forecast_data" in forecast_results:
@@ -1651,80 +2345,28 @@ class VisualizationTab(QWidget):
                 if not forecast_data.empty:
                     # Calculate cumulative forecast values (continuing from actual data)
                     last_cumulative = customdata.iloc[-1] if len(customdata) > 0 else 0
-                    forecast_cumulative = (
-                        last_cumulative + forecast_data["forecast"].cumsum()
+                    forecast_cumulative, forecast_converted = _convert_and_cum(
+                        forecast_data["forecast"].to_numpy(dtype=float),
+                        exchange_rate,
+                        start=last_cumulative,
                     )
 
                     # Add forecast line
-                    # Format forecast hover template with currency formatter
-                    if local_currency == "USD":
-                        fig.add_trace(
-                            go.Scatter(
-                                x=forecast_data.index,
-                                y=forecast_data["forecast"],
-                                mode="lines",
-                                name="Forecast",
-                                line=dict(color="#ff7f0e", width=2),
-                                customdata=forecast_cumulative,
-                                hovertemplate="<b>%{x}</b><br>"
-                                + "Forecast Revenue: %{y:,.2f} USD<br>"
-                                + "Cumulative Revenue: %{customdata:,.2f} USD<br>"
-                                + "<extra></extra>",
-                            )
-                        )
-                    else:
-                        exchange_rate = (
-                            self.currency_formatter.get_current_exchange_rate(
-                                local_currency
-                            )
+                    traces.append(
+                        dict(
+                            type="scattergl",
+                            **self._build_trace_spec(
+                                forecast_data["forecast"],
+                                forecast_cumulative,
+                                "Forecast",
+                                "Forecast Revenue",
+                                dict(color="#ff7f0e", width=2),
+                                local_currency,
+                                exchange_rate,
+                                forecast_converted,
+                            ),
                         )
-                        if exchange_rate is not None:
-                            # Pre-calculate converted values for forecast
-                            forecast_daily_converted = (
-                                forecast_data["forecast"] * exchange_rate
-                            )
-                            forecast_cumulative_converted = (
-                                forecast_cumulative * exchange_rate
-                            )
-
-                            # Create array of custom data: [daily_local, cumulative_usd, cumulative_local]
-                            forecast_custom_data_array = list(
-                                zip(
-                                    forecast_daily_converted,
-                                    forecast_cumulative,
-                                    forecast_cumulative_converted,
-                                )
-                            )
-
-                            fig.add_trace(
-                                go.Scatter(
-                                    x=forecast_data.index,
-                                    y=forecast_data["forecast"],
-                                    mode="lines",
-                                    name="Forecast",
-                                    line=dict(color="#ff7f0e", width=2),
-                                    customdata=forecast_custom_data_array,
-                                    hovertemplate="<b>%{x}</b><br>"
-                                    + f"Forecast Revenue: %{{y:,.2f}} USD (%{{customdata[0]:,.2f}} {local_currency})<br>"
-                                    + f"Cumulative Revenue: %{{customdata[1]:,.2f}} USD (%{{customdata[2]:,.2f}} {local_currency})<br>"
-                                    + "<extra></extra>",
-                                )
-                            )
-                        else:
-                            fig.add_trace(
-                                go.Scatter(
-                                    x=forecast_data.index,
-                                    y=forecast_data["forecast"],
-                                    mode="lines",
-                                    name="Forecast",
-                                    line=dict(color="#ff7f0e", width=2),
-                                    customdata=forecast_cumulative,
-                                    hovertemplate="<b>%{x}</b><br>"
-                                    + "Forecast Revenue: %{y:,.2f} USD<br>"
-                                    + "Cumulative Revenue: %{customdata:,.2f} USD<br>"
-                                    + "<extra></extra>",
-                                )
-                            )
+                    )
 
                     # Add confidence intervals if enabled
                     if (
@@ -1732,10 +2374,23 @@ class VisualizationTab(QWidget):
                         and "upper_ci" in forecast_data.columns
                         and "lower_ci" in forecast_data.columns
                     ):
-                        fig.add_trace(
-                            go.Scatter(
-                                x=forecast_data.index,
-                                y=forecast_data["upper_ci"],
+                        # Thin both bounds at the forecast line's points so
+                        # the band edges stay paired
+                        ci = forecast_data[["upper_ci", "lower_ci"]]
+                        positions = _lttb_indices(
+                            forecast_data["forecast"].to_numpy(dtype=np.float64),
+                            _MAX_TRACE_POINTS,
+                        )
+                        if positions is not None:
+                            ci = ci.iloc[positions]
+                        upper_ci = ci["upper_ci"]
+                        lower_ci = ci["lower_ci"]
+
+                        traces.append(
+                            dict(
+                                type="scattergl",
+                                x=upper_ci.index,
+                                y=upper_ci,
                                 mode="lines",
                                 line=dict(width=0),
                                 showlegend=False,
@@ -1743,10 +2398,11 @@ class VisualizationTab(QWidget):
                             )
                         )
 
-                        fig.add_trace(
-                            go.Scatter(
-                                x=forecast_data.index,
-                                y=forecast_data["lower_ci"],
+                        traces.append(
+                            dict(
+                                type="scattergl",
+                                x=lower_ci.index,
+                                y=lower_ci,
                                 mode="lines",
                                 fill="tonexty",
                                 fillcolor="rgba(255, 127, 14, 0.2)",
@@ -1771,183 +2427,46 @@ class VisualizationTab(QWidget):
                         # Find the cumulative value at the start of backtest period
                         backtest_start_date = backtest_forecast.index[0]
 
-                        # Get cumulative revenue up to backtest start
-                        backtest_start_cumulative = 0
-                        if backtest_start_date in customdata.index:
-                            backtest_start_cumulative = (
-                                customdata.loc[:backtest_start_date].iloc[-2]
-                                if len(customdata.loc[:backtest_start_date]) > 1
-                                else 0
-                            )
-                        elif len(customdata) > 0:
-                            # If backtest date is not in actual data, use the last cumulative value
-                            actual_end_date = customdata.index[-1]
-                            if backtest_start_date > actual_end_date:
-                                backtest_start_cumulative = customdata.iloc[-1]
-                            else:
-                                # Find the cumulative value at the closest date before backtest start
-                                backtest_start_cumulative = (
-                                    customdata[
-                                        customdata.index <= backtest_start_date
-                                    ].iloc[-1]
-                                    if len(
-                                        customdata[
-                                            customdata.index <= backtest_start_date
-                                        ]
-                                    )
-                                    > 0
-                                    else 0
-                                )
-
-                        backtest_cumulative = (
-                            backtest_start_cumulative
-                            + backtest_forecast["forecast"].cumsum()
+                        # Get cumulative revenue up to the day before the backtest
+                        # starts: the last actual date strictly before it, found
+                        # by binary search on the sorted date index
+                        start_pos = (
+                            customdata.index.searchsorted(backtest_start_date) - 1
+                        )
+                        backtest_start_cumulative = (
+                            customdata.iat[start_pos] if start_pos >= 0 else 0
                         )
 
-                        # Format backtest hover template with currency formatter
-                        if local_currency == "USD":
-                            fig.add_trace(
-                                go.Scatter(
-                                    x=backtest_forecast.index,
-                                    y=backtest_forecast["forecast"],
-                                    mode="lines",
-                                    name="Backtest Forecast",
-                                    line=dict(color="#2ca02c", width=2, dash="dot"),
-                                    customdata=backtest_cumulative,
-                                    hovertemplate="<b>%{x}</b><br>"
-                                    + "Backtest Forecast: %{y:,.2f} USD<br>"
-                                    + "Cumulative Revenue: %{customdata:,.2f} USD<br>"
-                                    + "<extra></extra>",
-                                )
-                            )
-                        else:
-                            exchange_rate = (
-                                self.currency_formatter.get_current_exchange_rate(
-                                    local_currency
-                                )
+                        backtest_cumulative, backtest_converted = _convert_and_cum(
+                            backtest_forecast["forecast"].to_numpy(dtype=float),
+                            exchange_rate,
+                            start=backtest_start_cumulative,
+                        )
+
+                        traces.append(
+                            dict(
+                                type="scattergl",
+                                **self._build_trace_spec(
+                                    backtest_forecast["forecast"],
+                                    backtest_cumulative,
+                                    "Backtest Forecast",
+                                    "Backtest Forecast",
+                                    dict(color="#2ca02c", width=2, dash="dot"),
+                                    local_currency,
+                                    exchange_rate,
+                                    backtest_converted,
+                                ),
                             )
-                            if exchange_rate is not None:
-                                # Pre-calculate converted values for backtest
-                                backtest_daily_converted = (
-                                    backtest_forecast["forecast"] * exchange_rate
-                                )
-                                backtest_cumulative_converted = (
-                                    backtest_cumulative * exchange_rate
-                                )
-
-                                # Create array of custom data: [daily_local, cumulative_usd, cumulative_local]
-                                backtest_custom_data_array = list(
-                                    zip(
-                                        backtest_daily_converted,
-                                        backtest_cumulative,
-                                        backtest_cumulative_converted,
-                                    )
-                                )
-
-                                fig.add_trace(
-                                    go.Scatter(
-                                        x=backtest_forecast.index,
-                                        y=backtest_forecast["forecast"],
-                                        mode="lines",
-                                        name="Backtest Forecast",
-                                        line=dict(color="#2ca02c", width=2, dash="dot"),
-                                        customdata=backtest_custom_data_array,
-                                        hovertemplate="<b>%{x}</b><br>"
-                                        + f"Backtest Forecast: %{{y:,.2f}} USD (%{{customdata[0]:,.2f}} {local_currency})<br>"
-                                        + f"Cumulative Revenue: %{{customdata[1]:,.2f}} USD (%{{customdata[2]:,.2f}} {local_currency})<br>"
-                                        + "<extra></extra>",
-                                    )
-                                )
-                            else:
-                                fig.add_trace(
-                                    go.Scatter(
-                                        x=backtest_forecast.index,
-                                        y=backtest_forecast["forecast"],
-                                        mode="lines",
-                                        name="Backtest Forecast",
-                                        line=dict(color="#2ca02c", width=2, dash="dot"),
-                                        customdata=backtest_cumulative,
-                                        hovertemplate="<b>%{x}</b><br>"
-                                        + "Backtest Forecast: %{y:,.2f} USD<br>"
-                                        + "Cumulative Revenue: %{customdata:,.2f} USD<br>"
-                                        + "<extra></extra>",
-                                    )
-                                )
-
-            # Update layout
-            fig.update_layout(
-                title="AdMob Revenue Forecast",
-                xaxis_title="Date",
-                yaxis_title="Revenue (USD)",
-                template="plotly_dark",
-                hovermode="x unified",
-                showlegend=True,
-                legend=dict(
-                    orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1
-                ),
-                paper_bgcolor="black",  # Black background
-                plot_bgcolor="black",  # Black plot area
-            )
+                        )
 
-            # Update y-axis to start from 0
-            fig.update_yaxes(rangemode="tozero")
+            # Build the figure in one go
+            fig = go.Figure(data=traces, layout=_REVENUE_CHART_LAYOUT)
+            self._drawn_state = state
 
             # Show chart
             if WEB_ENGINE_AVAILABLE:
                 try:
-                    # Generate HTML with config to avoid potential issues
-                    config = {
-                        "displayModeBar": True,
-                        "displaylogo": False,
-                        "modeBarButtonsToRemove": ["toImage", "downloadPlot"],
-                    }
-
-                    html = fig.to_html(
-                        include_plotlyjs=True, config=config, div_id="plotly-chart"
-                    )
-
-                    # Add custom CSS to remove all margins and padding
-                    css = """
-                    <style>
-                    html, body {
-                        margin: 0 !important;
-                        padding: 0 !important;
-                        width: 100% !important;
-                        height: 100% !important;
-                        background: transparent !important;
-                    }
-                    #plotly-chart {
-                        margin: 0 !important;
-                        padding: 0 !important;
-                        width: 100% !important;
-                        height: 100% !important;
-                    }
-                    </style>
-                    """
-
-                    # Insert CSS into the HTML head
-                    html = html.replace("<head>", f"<head>{css}")
-
-                    # Force webview to load the HTML
-                    self.web_view.setHtml(html)
-
-                    # Alternative: try loading from a temporary file if setHtml fails
-                    import tempfile
-                    import os
-
-                    # Create temporary HTML file
-                    with tempfile.NamedTemporaryFile(
-                        mode="w", suffix=".html", delete=False
-                    ) as f:
-                        f.write(html)
-                        temp_path = f.name
-
-                    # Load from file URL
-                    from PyQt6.QtCore import QUrl
-
-                    file_url = QUrl.fromLocalFile(os.path.abspath(temp_path))
-                    self.web_view.load(file_url)
-
+                    self.render_figure(fig)
                 except Exception as e:
                     # Fallback to simple HTML
                     self.web_view.setHtml(
@@ -1964,15 +2483,19 @@ class VisualizationTab(QWidget):
                     """
                     )
             else:
-                # Create text summary for non-web engine display
-                total_revenue = self.currency_formatter.format_currency(
-                    current_data["revenue"].sum()
-                )
-                avg_daily_revenue = self.currency_formatter.format_currency(
-                    current_data["revenue"].mean()
-                )
-                max_daily_revenue = self.currency_formatter.format_currency(
-                    current_data["revenue"].max()
+                # Create text summary for non-web engine display, reducing
+                # the revenue array directly and formatting it in one pass
+                revenue = current_data["revenue"].to_numpy(dtype=np.float64)
+                total_revenue, avg_daily_revenue, max_daily_revenue = (
+                    self.currency_formatter.format_currency_series(
+                        np.array(
+                            [
+                                np.nansum(revenue),
+                                np.nanmean(revenue),
+                                np.nanmax(revenue),
+                            ]
+                        )
+                    )
                 )
 
                 summary = f"""
@@ -1987,11 +2510,11 @@ class VisualizationTab(QWidget):
                 if forecast_results and "forecast_data" in forecast_results:
                     forecast_data = forecast_results["forecast_data"]
                     if not forecast_data.empty:
-                        predicted_avg_daily = self.currency_formatter.format_currency(
-                            forecast_data["forecast"].mean()
-                        )
-                        predicted_total = self.currency_formatter.format_currency(
-                            forecast_data["forecast"].sum()
+                        forecast = forecast_data["forecast"].to_numpy(dtype=np.float64)
+                        predicted_avg_daily, predicted_total = (
+                            self.currency_formatter.format_currency_series(
+                                np.array([np.nanmean(forecast), np.nansum(forecast)])
+                            )
                         )
 
                         summary += f"""
@@ -2028,6 +2551,8 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.config = config
         self.currency_formatter = currency_formatter
+        # (enabled, text) last applied to each tab, by tab index
+        self._tab_states = {}
         self.init_ui()
         self.setup_timers()
 
@@ -2111,30 +2636,33 @@ class MainWindow(QMainWindow):
         # Check if forecast is available
         has_forecast = bool(self.forecast_tab.get_forecast_results())
 
-        # Enable/disable tabs
-        self.tab_widget.setTabEnabled(self.data_tab_index, is_configured)
-        self.tab_widget.setTabEnabled(self.forecast_tab_index, has_data)
-        self.tab_widget.setTabEnabled(
-            self.visualization_tab_index, has_data and has_forecast
-        )
-
-        # Update tab text to indicate status
-        if is_configured:
-            self.tab_widget.setTabText(self.data_tab_index, "Data")
-        else:
-            self.tab_widget.setTabText(self.data_tab_index, "Data (No API Config)")
-
-        if has_data:
-            self.tab_widget.setTabText(self.forecast_tab_index, "Forecast")
-        else:
-            self.tab_widget.setTabText(self.forecast_tab_index, "Forecast (No Data)")
-
-        if has_data and has_forecast:
-            self.tab_widget.setTabText(self.visualization_tab_index, "Visualization")
-        else:
-            self.tab_widget.setTabText(
-                self.visualization_tab_index, "Visualization (No Forecast)"
-            )
+        tab_states = {
+            self.data_tab_index: (
+                is_configured,
+                "Data" if is_configured else "Data (No API Config)",
+            ),
+            self.forecast_tab_index: (
+                has_data,
+                "Forecast" if has_data else "Forecast (No Data)",
+            ),
+            self.visualization_tab_index: (
+                has_data and has_forecast,
+                (
+                    "Visualization"
+                    if has_data and has_forecast
+                    else "Visualization (No Forecast)"
+                ),
+            ),
+        }
+
+        # Enable/disable tabs and update their text to indicate status, only
+        # touching the tabs whose state changed
+        for index, (enabled, text) in tab_states.items():
+            if self._tab_states.get(index) == (enabled, text):
+                continue
+            self.tab_widget.setTabEnabled(index, enabled)
+            self.tab_widget.setTabText(index, text)
+            self._tab_states[index] = (enabled, text)
 
     def connect_tab_events(self):
         """Connect to tab events to update tab states"""
@@ -2152,10 +2680,9 @@ class MainWindow(QMainWindow):
             return result
 
         def forecast_ready_wrapper(forecast_data, results):
+            # The visualization tab redraws itself on forecast_changed
             result = original_forecast_ready(forecast_data, results)
             self.update_tab_states()
-            # Auto-update visualization
-            self.visualization_tab.update_chart()
             return result
 
         # Replace methods
@@ -2247,9 +2774,16 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         """Handle application close event"""
 
-        # Save current window size
-        self.config.set("ui_settings.window_width", self.width())
-        self.config.set("ui_settings.window_height", self.height())
+        # Don't lose a setting change whose auto-save hasn't fired yet
+        self.settings_tab.flush_pending_save()
+
+        # Save current window size; the file is only written if it changed
+        self.config.update(
+            {
+                "ui_settings.window_width": self.width(),
+                "ui_settings.window_height": self.height(),
+            }
+        )
 
         # Stop timers
         if hasattr(self, "refresh_timer"):